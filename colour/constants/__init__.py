@@ -4,7 +4,7 @@ from .cie import CONSTANT_K_M, CONSTANT_KP_M
 from .codata import (CONSTANT_AVOGADRO, CONSTANT_BOLTZMANN,
                      CONSTANT_LIGHT_SPEED, CONSTANT_PLANCK)
 from .common import (FLOATING_POINT_NUMBER_PATTERN, INTEGER_THRESHOLD, EPSILON,
-                     DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE)
+                     LOG2_10, DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE)
 
 __all__ = ['CONSTANT_K_M', 'CONSTANT_KP_M']
 __all__ += [
@@ -12,6 +12,6 @@ __all__ += [
     'CONSTANT_PLANCK'
 ]
 __all__ += [
-    'FLOATING_POINT_NUMBER_PATTERN', 'INTEGER_THRESHOLD', 'EPSILON',
+    'FLOATING_POINT_NUMBER_PATTERN', 'INTEGER_THRESHOLD', 'EPSILON', 'LOG2_10',
     'DEFAULT_FLOAT_DTYPE', 'DEFAULT_INT_DTYPE'
 ]
@@ -20,7 +20,7 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'FLOATING_POINT_NUMBER_PATTERN', 'INTEGER_THRESHOLD', 'EPSILON',
+    'FLOATING_POINT_NUMBER_PATTERN', 'INTEGER_THRESHOLD', 'EPSILON', 'LOG2_10',
     'DEFAULT_FLOAT_DTYPE', 'DEFAULT_INT_DTYPE'
 ]
 
@@ -49,6 +49,14 @@ computations.
 EPSILON : numeric
 """
 
+LOG2_10 = np.log2(10)
+"""
+Base 2 logarithm of 10, allows to evaluate :math:`10^x` as
+:math:`2^{x\\log_2 10}` with :func:`np.exp2` definition.
+
+LOG2_10 : numeric
+"""
+
 DEFAULT_FLOAT_DTYPE = np.sctypeDict.get(
     os.environ.get('COLOUR_SCIENCE__FLOAT_PRECISION', 'float64'), 'float64')
 """
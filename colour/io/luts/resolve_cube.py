@@ -168,9 +168,15 @@ def read_LUT_ResolveCube(path):
                 has_3D = True
                 size_3D = np.int_(tokens[1])
             else:
-                table.append(tokens)
+                if len(tokens) != 3:
+                    raise ValueError(
+                        '"{0}" table row does not have 3 values!'.format(line))
 
-    table = as_float_array(table)
+                table.extend(tokens)
+
+    # The table is accumulated as a flat list of tokens, sparing *Numpy* the
+    # nested sequences shape discovery during the conversion.
+    table = as_float_array(table).reshape([-1, 3])
     if has_3x1D and has_3D:
         LUT[0].name = '{0} - Shaper'.format(title)
         LUT[1].name = '{0} - Cube'.format(title)
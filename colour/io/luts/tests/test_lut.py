@@ -13,7 +13,7 @@ from colour.io.luts.lut import AbstractLUT
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT3x1D, LUT3D,
                             LUTSequence, LUT_to_LUT)
 from colour.models import gamma_function
-from colour.utilities import tsplit, tstack
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -30,9 +30,9 @@ __all__ = [
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
 
-RANDOM_TRIPLETS = np.reshape(
-    random_triplet_generator(8, random_state=np.random.RandomState(4)),
-    (4, 2, 3))
+RANDOM_TRIPLETS = random_triplet_generator(
+    8, random_state=np.random.RandomState(4)).reshape([4, 2, 3])
+RANDOM_TRIPLETS.setflags(write=False)
 
 
 class TestAbstractLUT(unittest.TestCase):
@@ -48,8 +48,8 @@ class TestAbstractLUT(unittest.TestCase):
         required_attributes = ('table', 'name', 'dimensions', 'domain', 'size',
                                'comments')
 
-        for attribute in required_attributes:
-            self.assertIn(attribute, dir(AbstractLUT))
+        self.assertSetEqual(
+            set(required_attributes).difference(dir(AbstractLUT)), set())
 
     def test_required_methods(self):
         """
@@ -63,8 +63,8 @@ class TestAbstractLUT(unittest.TestCase):
                             'arithmetical_operation', 'is_domain_explicit',
                             'linear_table', 'apply', 'copy', 'as_LUT')
 
-        for method in required_methods:
-            self.assertIn(method, dir(AbstractLUT))
+        self.assertSetEqual(
+            set(required_methods).difference(dir(AbstractLUT)), set())
 
 
 class TestLUT(unittest.TestCase):
@@ -74,47 +74,65 @@ class TestLUT(unittest.TestCase):
     :class:`colour.io.luts.lut.LUT3D` classes common unit tests methods.
     """
 
-    def __init__(self, *args):
-        """
-        Create an instance of the class.
-
-        Other Parameters
-        ----------------
-        \\*args : list, optional
-            Arguments.
-        """
+    _LUT_factory = None
+    _LUT_unity = None
+
+    _domain_1 = None
+    _domain_2 = None
+    _domain_3 = None
+    _table_1 = None
+    _table_2 = None
+    _table_3 = None
+    _table_1_add_10 = None
+    _table_1_sub_10 = None
+    _table_1_mul_10 = None
+    _table_1_div_10 = None
+    _table_1_pow_10 = None
+    _table_3_kwargs = None
+    _dimensions = None
+    _str = None
+    _repr = None
+    _applied_1 = None
+    _applied_2 = None
+    _applied_3 = None
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        if cls._LUT_factory is None:
+            return
 
-        super(TestLUT, self).__init__(*args)
+        # pylint: disable=E1102
+        cls._LUT_unity = cls._LUT_factory()
+        cls._LUT_unity.table.setflags(write=False)
 
-        self._LUT_factory = None
+        cls._table_1_add_10 = cls._table_1 + 10
+        cls._table_1_sub_10 = cls._table_1 - 10
+        cls._table_1_mul_10 = cls._table_1 * 10
+        cls._table_1_div_10 = cls._table_1 / 10
+        cls._table_1_pow_10 = cls._table_1 ** 10
 
-        self._domain_1 = None
-        self._domain_2 = None
-        self._domain_3 = None
-        self._table_1 = None
-        self._table_2 = None
-        self._table_3 = None
-        self._table_1_kwargs = None
-        self._table_2_kwargs = None
-        self._table_3_kwargs = None
-        self._dimensions = None
-        self._str = None
-        self._repr = None
-        self._applied_1 = None
-        self._applied_2 = None
-        self._applied_3 = None
+        for array in (cls._table_1_add_10, cls._table_1_sub_10,
+                      cls._table_1_mul_10, cls._table_1_div_10,
+                      cls._table_1_pow_10):
+            array.setflags(write=False)
 
     def test_required_methods(self):
         """
         Tests presence of required methods.
         """
 
+        if self._LUT_factory is None:
+            return
+
         required_methods = ('__init__', 'is_domain_explicit', 'linear_table',
                             'apply', 'as_LUT')
 
-        for class_ in (LUT1D, LUT3x1D, LUT3D):
-            for method in required_methods:
-                self.assertIn(method, dir(class_))
+        self.assertSetEqual(
+            set(required_methods).difference(dir(self._LUT_factory)), set())
 
     def test__init__(self):
         """
@@ -131,7 +149,8 @@ class TestLUT(unittest.TestCase):
 
         np.testing.assert_almost_equal(LUT.table, self._table_1, decimal=7)
 
-        self.assertEqual(str(id(LUT)), LUT.name)
+        self.assertTrue(LUT.name.isdigit())
+        self.assertEqual(int(LUT.name), id(LUT))
 
         np.testing.assert_array_equal(LUT.domain, self._domain_1)
 
@@ -173,12 +192,11 @@ class TestLUT(unittest.TestCase):
         # pylint: disable=E1102
         LUT = self._LUT_factory(self._table_1)
 
-        self.assertEqual(LUT.name, str(id(LUT)))
+        self.assertTrue(LUT.name.isdigit())
+        self.assertEqual(int(LUT.name), id(LUT))
 
-        # pylint: disable=E1102
-        LUT = self._LUT_factory()
-
-        self.assertEqual(LUT.name, 'Unity {0}'.format(self._table_1.shape[0]))
+        self.assertEqual(self._LUT_unity.name,
+                         'Unity {0}'.format(self._table_1.shape[0]))
 
     def test_domain(self):
         """
@@ -209,10 +227,7 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT = self._LUT_factory()
-
-        self.assertEqual(LUT.size, LUT.table.shape[0])
+        self.assertEqual(self._LUT_unity.size, self._LUT_unity.table.shape[0])
 
     def test_dimensions(self):
         """
@@ -224,10 +239,7 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT = self._LUT_factory()
-
-        self.assertEqual(LUT.dimensions, self._dimensions)
+        self.assertEqual(self._LUT_unity.dimensions, self._dimensions)
 
     def test_comments(self):
         """
@@ -239,9 +251,7 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT = self._LUT_factory()
-        self.assertListEqual(LUT.comments, [])
+        self.assertListEqual(self._LUT_unity.comments, [])
 
         comments = ['A first comment.', 'A second comment.']
         # pylint: disable=E1102
@@ -274,9 +284,6 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT = self._LUT_factory(name='Nemo')
-
         # The default LUT representation is too large to be embedded, given
         # that :class:`colour.io.luts.lut.LUT3D.__str__` method is defined by
         # :class:`colour.io.luts.lut.AbstractLUT.__str__` method, the two other
@@ -284,6 +291,9 @@ class TestLUT(unittest.TestCase):
         if self._dimensions == 3:
             return
 
+        # pylint: disable=E1102
+        LUT = self._LUT_factory(name='Nemo')
+
         self.assertEqual(repr(LUT), self._repr)
 
     def test__eq__(self):
@@ -296,12 +306,10 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT_1 = self._LUT_factory()
         # pylint: disable=E1102
         LUT_2 = self._LUT_factory()
 
-        self.assertEqual(LUT_1, LUT_2)
+        self.assertEqual(self._LUT_unity, LUT_2)
 
     def test__ne__(self):
         """
@@ -313,18 +321,16 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT_1 = self._LUT_factory()
         # pylint: disable=E1102
         LUT_2 = self._LUT_factory()
 
         LUT_2 += 0.1
-        self.assertNotEqual(LUT_1, LUT_2)
+        self.assertNotEqual(self._LUT_unity, LUT_2)
 
         # pylint: disable=E1102
         LUT_2 = self._LUT_factory()
         LUT_2.domain = self._domain_1 * 0.8 + 0.1
-        self.assertNotEqual(LUT_1, LUT_2)
+        self.assertNotEqual(self._LUT_unity, LUT_2)
 
     def test_is_domain_explicit(self):
         """
@@ -336,8 +342,7 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        self.assertFalse(self._LUT_factory().is_domain_explicit())
+        self.assertFalse(self._LUT_unity.is_domain_explicit())
 
         # pylint: disable=E1102
         self.assertTrue(
@@ -354,88 +359,111 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT_1 = self._LUT_factory()
-        # pylint: disable=E1102
-        LUT_2 = self._LUT_factory()
+        LUT_1 = self._LUT_unity
 
         np.testing.assert_almost_equal(
             LUT_1.arithmetical_operation(10, '+', False).table,
-            self._table_1 + 10,
+            self._table_1_add_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
             LUT_1.arithmetical_operation(10, '-', False).table,
-            self._table_1 - 10,
+            self._table_1_sub_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
             LUT_1.arithmetical_operation(10, '*', False).table,
-            self._table_1 * 10,
+            self._table_1_mul_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
             LUT_1.arithmetical_operation(10, '/', False).table,
-            self._table_1 / 10,
+            self._table_1_div_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
             LUT_1.arithmetical_operation(10, '**', False).table,
-            self._table_1 ** 10,
+            self._table_1_pow_10,
             decimal=7)
 
-        np.testing.assert_almost_equal(
-            (LUT_1 + 10).table, self._table_1 + 10, decimal=7)
+        # pylint: disable=E1102
+        LUT_2 = self._LUT_factory()
 
         np.testing.assert_almost_equal(
-            (LUT_1 - 10).table, self._table_1 - 10, decimal=7)
+            LUT_2.arithmetical_operation(self._table_1, '+', False).table,
+            LUT_2.table + self._table_1,
+            decimal=7)
 
         np.testing.assert_almost_equal(
-            (LUT_1 * 10).table, self._table_1 * 10, decimal=7)
+            LUT_2.arithmetical_operation(LUT_2, '+', False).table,
+            LUT_2.table + LUT_2.table,
+            decimal=7)
 
-        np.testing.assert_almost_equal(
-            (LUT_1 / 10).table, self._table_1 / 10, decimal=7)
+    def test_arithmetical_operation_in_place(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.arithmetical_operation`,
+        :class:`colour.io.luts.lut.LUT3x1D.arithmetical_operation` and
+        :class:`colour.io.luts.lut.LUT3D.arithmetical_operation` methods
+        in-place operations.
+        """
 
-        np.testing.assert_almost_equal(
-            (LUT_1 ** 10).table, self._table_1 ** 10, decimal=7)
+        if self._LUT_factory is None:
+            return
+
+        # pylint: disable=E1102
+        LUT = self._LUT_factory()
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(10, '+', True).table,
-            self._table_1 + 10,
+            LUT.arithmetical_operation(10, '+', True).table,
+            self._table_1_add_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(10, '-', True).table,
+            LUT.arithmetical_operation(10, '-', True).table,
             self._table_1,
             decimal=7)
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(10, '*', True).table,
-            self._table_1 * 10,
+            LUT.arithmetical_operation(10, '*', True).table,
+            self._table_1_mul_10,
             decimal=7)
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(10, '/', True).table,
+            LUT.arithmetical_operation(10, '/', True).table,
             self._table_1,
             decimal=7)
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(10, '**', True).table,
-            self._table_1 ** 10,
+            LUT.arithmetical_operation(10, '**', True).table,
+            self._table_1_pow_10,
             decimal=7)
 
-        # pylint: disable=E1102
-        LUT_2 = self._LUT_factory()
+    def test_arithmetical_operators(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D`,
+        :class:`colour.io.luts.lut.LUT3x1D` and
+        :class:`colour.io.luts.lut.LUT3D` classes arithmetical operators.
+        """
+
+        if self._LUT_factory is None:
+            return
+
+        LUT = self._LUT_unity
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(self._table_1, '+', False).table,
-            LUT_2.table + self._table_1,
-            decimal=7)
+            (LUT + 10).table, self._table_1_add_10, decimal=7)
 
         np.testing.assert_almost_equal(
-            LUT_2.arithmetical_operation(LUT_2, '+', False).table,
-            LUT_2.table + LUT_2.table,
-            decimal=7)
+            (LUT - 10).table, self._table_1_sub_10, decimal=7)
+
+        np.testing.assert_almost_equal(
+            (LUT * 10).table, self._table_1_mul_10, decimal=7)
+
+        np.testing.assert_almost_equal(
+            (LUT / 10).table, self._table_1_div_10, decimal=7)
+
+        np.testing.assert_almost_equal(
+            (LUT ** 10).table, self._table_1_pow_10, decimal=7)
 
     def test_linear_table(self):
         """
@@ -447,11 +475,8 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT_1 = self._LUT_factory()
-
         np.testing.assert_almost_equal(
-            LUT_1.linear_table(), self._table_1, decimal=7)
+            self._LUT_unity.linear_table(), self._table_1, decimal=7)
 
         np.testing.assert_almost_equal(
             spow(
@@ -499,8 +524,7 @@ class TestLUT(unittest.TestCase):
         if self._LUT_factory is None:
             return
 
-        # pylint: disable=E1102
-        LUT_1 = self._LUT_factory()
+        LUT_1 = self._LUT_unity
 
         self.assertIsNot(LUT_1, LUT_1.copy())
         self.assertEqual(LUT_1, LUT_1.copy())
@@ -511,73 +535,73 @@ class TestLUT1D(TestLUT):
     Defines :class:`colour.io.luts.lut.LUT1D` class unit tests methods.
     """
 
-    def __init__(self, *args):
-        """
-        Create an instance of the class.
-
-        Other Parameters
-        ----------------
-        \\*args : list, optional
-            Arguments.
-        """
-
-        super(TestLUT1D, self).__init__(*args)
+    _str = textwrap.dedent("""
+        LUT1D - Nemo
+        ------------
 
-        self._LUT_factory = LUT1D
-
-        self._domain_1 = np.array([0, 1])
-        self._domain_2 = np.array([-0.1, 1.5])
-        self._domain_3 = np.linspace(-0.1, 1.5, 10)
-        self._table_1 = np.linspace(0, 1, 10)
-        self._table_2 = self._table_1 ** (1 / 2.2)
-        self._table_3 = spow(np.linspace(-0.1, 1.5, 10), (1 / 2.6))
-        self._table_1_kwargs = {'size': 10, 'domain': self._domain_1}
-        self._table_2_kwargs = {'size': 10, 'domain': self._domain_2}
-        self._table_3_kwargs = {'size': 10, 'domain': self._domain_3}
-        self._dimensions = 1
-        self._str = textwrap.dedent("""
-            LUT1D - Nemo
-            ------------
-
-            Dimensions : 1
-            Domain     : [ 0.  1.]
-            Size       : (10,)""")[1:]
-        self._repr = textwrap.dedent("""
+        Dimensions : 1
+        Domain     : [ 0.  1.]
+        Size       : (10,)""")[1:]
+    _repr = textwrap.dedent("""
     LUT1D([ 0.        ,  0.11111111,  0.22222222,  0.33333333,  0.44444444,
             0.55555556,  0.66666667,  0.77777778,  0.88888889,  1.        ],
           name='Nemo',
           domain=[ 0.,  1.])""")[1:]
-        self._applied_1 = np.array([
-            [[0.98453144, 0.53304051, 0.02978976],
-             [0.76000720, 0.68433298, 0.64753760]],
-            [[0.98718436, 0.89285575, 0.14639477],
-             [0.85784314, 0.47463489, 0.97966294]],
-            [[0.84855994, 0.93486051, 0.68536703],
-             [0.49723089, 0.99221212, 0.97606176]],
-            [[0.98886872, 0.43308440, 0.89633381],
-             [0.02065388, 0.79040970, 0.93651642]],
-        ])
-        self._applied_2 = np.array([
-            [[0.98486877, 0.53461565, 0.05614915],
-             [0.75787807, 0.68473291, 0.64540281]],
-            [[0.98736681, 0.89255862, 0.18759013],
-             [0.85682563, 0.46473837, 0.97981413]],
-            [[0.84736915, 0.93403795, 0.68561444],
-             [0.48799540, 0.99210103, 0.97606266]],
-            [[0.98895283, 0.42197234, 0.89639002],
-             [0.04585089, 0.79047033, 0.93564890]],
-        ])
 
-        self._applied_3 = np.array([
-            [[0.98718085, 0.58856660, 0.06995805],
-             [0.79062078, 0.72580416, 0.68991332]],
-            [[0.98928698, 0.90826591, 0.22565356],
-             [0.87725399, 0.52099138, 0.98286533]],
-            [[0.86904691, 0.94376678, 0.72658532],
-             [0.54348223, 0.99327846, 0.97966110]],
-            [[0.99062417, 0.47963425, 0.91159110],
-             [0.05775947, 0.81950198, 0.94514273]],
-        ])
+    _applied_1 = np.array([
+        [[0.98453144, 0.53304051, 0.02978976],
+         [0.76000720, 0.68433298, 0.64753760]],
+        [[0.98718436, 0.89285575, 0.14639477],
+         [0.85784314, 0.47463489, 0.97966294]],
+        [[0.84855994, 0.93486051, 0.68536703],
+         [0.49723089, 0.99221212, 0.97606176]],
+        [[0.98886872, 0.43308440, 0.89633381],
+         [0.02065388, 0.79040970, 0.93651642]],
+    ])
+    _applied_2 = np.array([
+        [[0.98486877, 0.53461565, 0.05614915],
+         [0.75787807, 0.68473291, 0.64540281]],
+        [[0.98736681, 0.89255862, 0.18759013],
+         [0.85682563, 0.46473837, 0.97981413]],
+        [[0.84736915, 0.93403795, 0.68561444],
+         [0.48799540, 0.99210103, 0.97606266]],
+        [[0.98895283, 0.42197234, 0.89639002],
+         [0.04585089, 0.79047033, 0.93564890]],
+    ])
+    _applied_3 = np.array([
+        [[0.98718085, 0.58856660, 0.06995805],
+         [0.79062078, 0.72580416, 0.68991332]],
+        [[0.98928698, 0.90826591, 0.22565356],
+         [0.87725399, 0.52099138, 0.98286533]],
+        [[0.86904691, 0.94376678, 0.72658532],
+         [0.54348223, 0.99327846, 0.97966110]],
+        [[0.99062417, 0.47963425, 0.91159110],
+         [0.05775947, 0.81950198, 0.94514273]],
+    ])
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._LUT_factory = LUT1D
+
+        cls._domain_1 = np.array([0, 1])
+        cls._domain_2 = np.array([-0.1, 1.5])
+        cls._domain_3 = np.linspace(-0.1, 1.5, 10)
+        cls._table_1 = np.linspace(0, 1, 10)
+        cls._table_2 = cls._table_1 ** (1 / 2.2)
+        cls._table_3 = spow(cls._domain_3, 1 / 2.6)
+        cls._table_3_kwargs = {'size': 10, 'domain': cls._domain_3}
+        cls._dimensions = 1
+
+        for array in (cls._domain_1, cls._domain_2, cls._domain_3,
+                      cls._table_1, cls._table_2, cls._table_3, cls._applied_1,
+                      cls._applied_2, cls._applied_3):
+            array.setflags(write=False)
+
+        super(TestLUT1D, cls).setUpClass()
 
 
 class TestLUT3x1D(TestLUT):
@@ -585,97 +609,93 @@ class TestLUT3x1D(TestLUT):
     Defines :class:`colour.io.luts.lut.LUT3x1D` class unit tests methods.
     """
 
-    def __init__(self, *args):
-        """
-        Create an instance of the class.
-
-        Other Parameters
-        ----------------
-        \\*args : list, optional
-            Arguments.
-        """
-
-        super(TestLUT3x1D, self).__init__(*args)
-
-        self._LUT_factory = LUT3x1D
+    _str = textwrap.dedent("""
+        LUT3x1D - Nemo
+        --------------
+
+        Dimensions : 2
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (10, 3)""")[1:]
+    _repr = textwrap.dedent("""
+        LUT3x1D([[ 0.        ,  0.        ,  0.        ],
+                 [ 0.11111111,  0.11111111,  0.11111111],
+                 [ 0.22222222,  0.22222222,  0.22222222],
+                 [ 0.33333333,  0.33333333,  0.33333333],
+                 [ 0.44444444,  0.44444444,  0.44444444],
+                 [ 0.55555556,  0.55555556,  0.55555556],
+                 [ 0.66666667,  0.66666667,  0.66666667],
+                 [ 0.77777778,  0.77777778,  0.77777778],
+                 [ 0.88888889,  0.88888889,  0.88888889],
+                 [ 1.        ,  1.        ,  1.        ]],
+                name='Nemo',
+                domain=[[ 0.,  0.,  0.],
+                        [ 1.,  1.,  1.]])""")[1:]
+
+    _applied_1 = np.array([
+        [[0.98453144, 0.53304051, 0.02978976],
+         [0.76000720, 0.68433298, 0.64753760]],
+        [[0.98718436, 0.89285575, 0.14639477],
+         [0.85784314, 0.47463489, 0.97966294]],
+        [[0.84855994, 0.93486051, 0.68536703],
+         [0.49723089, 0.99221212, 0.97606176]],
+        [[0.98886872, 0.43308440, 0.89633381],
+         [0.02065388, 0.79040970, 0.93651642]],
+    ])
+    _applied_2 = np.array([
+        [[0.98453144, 0.53461565, 0.05393585],
+         [0.76000720, 0.68473291, 0.62923633]],
+        [[0.98718436, 0.89255862, 0.14399599],
+         [0.85784314, 0.46473837, 0.97713337]],
+        [[0.84855994, 0.93403795, 0.67216031],
+         [0.49723089, 0.99210103, 0.97371216]],
+        [[0.98886872, 0.42197234, 0.89183123],
+         [0.02065388, 0.79047033, 0.93681229]],
+    ])
+    _applied_3 = np.array([
+        [[0.98685765, 0.58844468, 0.09393531],
+         [0.79274650, 0.72453018, 0.69347904]],
+        [[0.98911162, 0.90807837, 0.25736920],
+         [0.87825083, 0.53046097, 0.98225775]],
+        [[0.87021380, 0.94442819, 0.72448386],
+         [0.55350090, 0.99318691, 0.97922787]],
+        [[0.99054268, 0.49317779, 0.91055390],
+         [0.02408419, 0.81991814, 0.94597809]],
+    ])
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._LUT_factory = LUT3x1D
 
         samples_1 = np.linspace(0, 1, 10)
         samples_2 = np.linspace(-0.1, 1.5, 15)
         samples_3 = np.linspace(-0.1, 3.0, 20)
-        self._domain_1 = np.array([[0, 0, 0], [1, 1, 1]])
-        self._domain_2 = np.array([[0, -0.1, -0.2], [1, 1.5, 3.0]])
-        self._domain_3 = tstack([
+        cls._domain_1 = np.array([[0, 0, 0], [1, 1, 1]])
+        cls._domain_2 = np.array([[0, -0.1, -0.2], [1, 1.5, 3.0]])
+        cls._domain_3 = tstack([
             np.hstack([samples_1, np.full(10, np.nan)]),
             np.hstack([samples_2, np.full(5, np.nan)]),
             samples_3,
         ])
-        self._table_1 = tstack([samples_1, samples_1, samples_1])
-        self._table_2 = self._table_1 ** (1 / 2.2)
-        self._table_3 = spow(
-            tstack([
-                np.hstack([samples_1, np.full(10, np.nan)]),
-                np.hstack([samples_2, np.full(5, np.nan)]),
-                samples_3,
-            ]), 1 / 2.6)
-        self._table_1_kwargs = {'size': 10, 'domain': self._domain_1}
-        self._table_2_kwargs = {'size': 10, 'domain': self._domain_2}
-        self._table_3_kwargs = {
+        cls._table_1 = tstack([samples_1, samples_1, samples_1])
+        cls._table_2 = cls._table_1 ** (1 / 2.2)
+        cls._table_3 = spow(cls._domain_3, 1 / 2.6)
+        cls._table_3_kwargs = {
             'size': np.array([10, 15, 20]),
-            'domain': self._domain_3
+            'domain': cls._domain_3
         }
-        self._dimensions = 2
-        self._str = textwrap.dedent("""
-            LUT3x1D - Nemo
-            --------------
-
-            Dimensions : 2
-            Domain     : [[ 0.  0.  0.]
-                          [ 1.  1.  1.]]
-            Size       : (10, 3)""")[1:]
-        self._repr = textwrap.dedent("""
-            LUT3x1D([[ 0.        ,  0.        ,  0.        ],
-                     [ 0.11111111,  0.11111111,  0.11111111],
-                     [ 0.22222222,  0.22222222,  0.22222222],
-                     [ 0.33333333,  0.33333333,  0.33333333],
-                     [ 0.44444444,  0.44444444,  0.44444444],
-                     [ 0.55555556,  0.55555556,  0.55555556],
-                     [ 0.66666667,  0.66666667,  0.66666667],
-                     [ 0.77777778,  0.77777778,  0.77777778],
-                     [ 0.88888889,  0.88888889,  0.88888889],
-                     [ 1.        ,  1.        ,  1.        ]],
-                    name='Nemo',
-                    domain=[[ 0.,  0.,  0.],
-                            [ 1.,  1.,  1.]])""")[1:]
-        self._applied_1 = np.array([
-            [[0.98453144, 0.53304051, 0.02978976],
-             [0.76000720, 0.68433298, 0.64753760]],
-            [[0.98718436, 0.89285575, 0.14639477],
-             [0.85784314, 0.47463489, 0.97966294]],
-            [[0.84855994, 0.93486051, 0.68536703],
-             [0.49723089, 0.99221212, 0.97606176]],
-            [[0.98886872, 0.43308440, 0.89633381],
-             [0.02065388, 0.79040970, 0.93651642]],
-        ])
-        self._applied_2 = np.array([
-            [[0.98453144, 0.53461565, 0.05393585],
-             [0.76000720, 0.68473291, 0.62923633]],
-            [[0.98718436, 0.89255862, 0.14399599],
-             [0.85784314, 0.46473837, 0.97713337]],
-            [[0.84855994, 0.93403795, 0.67216031],
-             [0.49723089, 0.99210103, 0.97371216]],
-            [[0.98886872, 0.42197234, 0.89183123],
-             [0.02065388, 0.79047033, 0.93681229]],
-        ])
-        self._applied_3 = np.array([
-            [[0.98685765, 0.58844468, 0.09393531],
-             [0.79274650, 0.72453018, 0.69347904]],
-            [[0.98911162, 0.90807837, 0.25736920],
-             [0.87825083, 0.53046097, 0.98225775]],
-            [[0.87021380, 0.94442819, 0.72448386],
-             [0.55350090, 0.99318691, 0.97922787]],
-            [[0.99054268, 0.49317779, 0.91055390],
-             [0.02408419, 0.81991814, 0.94597809]],
-        ])
+        cls._dimensions = 2
+
+        for array in (cls._domain_1, cls._domain_2, cls._domain_3,
+                      cls._table_1, cls._table_2, cls._table_3, cls._applied_1,
+                      cls._applied_2, cls._applied_3):
+            array.setflags(write=False)
+
+        super(TestLUT3x1D, cls).setUpClass()
 
 
 class TestLUT3D(TestLUT):
@@ -683,96 +703,87 @@ class TestLUT3D(TestLUT):
     Defines :class:`colour.io.luts.lut.LUT3D` class unit tests methods.
     """
 
-    def __init__(self, *args):
-        """
-        Create an instance of the class.
-
-        Other Parameters
-        ----------------
-        \\*args : list, optional
-            Arguments.
-        """
-
-        super(TestLUT3D, self).__init__(*args)
-
-        self._LUT_factory = LUT3D
+    _str = textwrap.dedent("""
+        LUT3D - Nemo
+        ------------
+
+        Dimensions : 3
+        Domain     : [[ 0.  0.  0.]
+                      [ 1.  1.  1.]]
+        Size       : (33, 33, 33, 3)""")[1:]
+    _repr = None
+
+    _applied_1 = np.array([
+        [[0.98486974, 0.53531556, 0.05950617],
+         [0.76022687, 0.68479344, 0.64907649]],
+        [[0.98747624, 0.89287549, 0.23859990],
+         [0.85844632, 0.47829965, 0.98002765]],
+        [[0.84903362, 0.93518100, 0.68577990],
+         [0.49827272, 0.99238949, 0.97644600]],
+        [[0.98912224, 0.43911364, 0.89645863],
+         [0.04125691, 0.79116284, 0.93680839]],
+    ])
+    _applied_2 = np.array([
+        [[0.98486974, 0.53526504, 0.03155191],
+         [0.76022687, 0.68458573, 0.64850011]],
+        [[0.98747624, 0.89277461, 0.15505443],
+         [0.85844632, 0.47842591, 0.97972986]],
+        [[0.84903362, 0.93514331, 0.68479574],
+         [0.49827272, 0.99234923, 0.97614054]],
+        [[0.98912224, 0.43850620, 0.89625878],
+         [0.04125691, 0.79115345, 0.93648599]],
+    ])
+    _applied_3 = np.array([
+        [[0.98685765, 0.58844468, 0.09393531],
+         [0.79274650, 0.72453018, 0.69347904]],
+        [[0.98911162, 0.90807837, 0.25736920],
+         [0.87825083, 0.53046097, 0.98225775]],
+        [[0.87021380, 0.94442819, 0.72448386],
+         [0.55350090, 0.99318691, 0.97922787]],
+        [[0.99054268, 0.49317779, 0.91055390],
+         [0.02408419, 0.81991814, 0.94597809]],
+    ])
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._LUT_factory = LUT3D
 
         samples_1 = np.linspace(0, 1, 10)
         samples_2 = np.linspace(-0.1, 1.5, 15)
         samples_3 = np.linspace(-0.1, 3.0, 20)
-        self._domain_1 = np.array([[0, 0, 0], [1, 1, 1]])
-        self._domain_2 = np.array([[0, -0.1, -0.2], [1, 1.5, 3.0]])
-        self._domain_3 = tstack([
+        cls._domain_1 = np.array([[0, 0, 0], [1, 1, 1]])
+        cls._domain_2 = np.array([[0, -0.1, -0.2], [1, 1.5, 3.0]])
+        cls._domain_3 = tstack([
             np.hstack([samples_1, np.full(10, np.nan)]),
             np.hstack([samples_2, np.full(5, np.nan)]),
             samples_3,
         ])
-        self._table_1 = np.meshgrid(
-            *[
-                np.linspace(axes[0], axes[1], 33)
-                for axes in reversed(tsplit(self._domain_1))
-            ],
-            indexing='ij')
-        self._table_1 = np.flip(
-            np.transpose(self._table_1).reshape([33, 33, 33, 3]), -1)
-        self._table_2 = self._table_1 ** (1 / 2.2)
-        self._table_3 = np.meshgrid(
-            *[
-                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
-                for axes in reversed(tsplit(self._domain_3))
-            ],
-            indexing='ij')
-        self._table_3 = spow(
-            np.flip(np.transpose(self._table_3).reshape([10, 15, 20, 3]), -1),
-            1 / 2.6)
-        self._table_1_kwargs = {'size': 33, 'domain': self._domain_1}
-        self._table_2_kwargs = {'size': 33, 'domain': self._domain_2}
-        self._table_3_kwargs = {
+        samples = np.linspace(0, 1, 33)
+        cls._table_1 = np.empty([33, 33, 33, 3])
+        cls._table_1[..., 0] = samples[:, np.newaxis, np.newaxis]
+        cls._table_1[..., 1] = samples[np.newaxis, :, np.newaxis]
+        cls._table_1[..., 2] = samples[np.newaxis, np.newaxis, :]
+        cls._table_2 = cls._table_1 ** (1 / 2.2)
+        cls._table_3 = np.empty([10, 15, 20, 3])
+        cls._table_3[..., 0] = samples_1[:, np.newaxis, np.newaxis]
+        cls._table_3[..., 1] = samples_2[np.newaxis, :, np.newaxis]
+        cls._table_3[..., 2] = samples_3[np.newaxis, np.newaxis, :]
+        cls._table_3 = spow(cls._table_3, 1 / 2.6)
+        cls._table_3_kwargs = {
             'size': np.array([10, 15, 20]),
-            'domain': self._domain_3
+            'domain': cls._domain_3
         }
-        self._dimensions = 3
-        self._str = textwrap.dedent("""
-            LUT3D - Nemo
-            ------------
-
-            Dimensions : 3
-            Domain     : [[ 0.  0.  0.]
-                          [ 1.  1.  1.]]
-            Size       : (33, 33, 33, 3)""")[1:]
-        self._repr = None
-        self._applied_1 = np.array([
-            [[0.98486974, 0.53531556, 0.05950617],
-             [0.76022687, 0.68479344, 0.64907649]],
-            [[0.98747624, 0.89287549, 0.23859990],
-             [0.85844632, 0.47829965, 0.98002765]],
-            [[0.84903362, 0.93518100, 0.68577990],
-             [0.49827272, 0.99238949, 0.97644600]],
-            [[0.98912224, 0.43911364, 0.89645863],
-             [0.04125691, 0.79116284, 0.93680839]],
-        ])
+        cls._dimensions = 3
+        for array in (cls._domain_1, cls._domain_2, cls._domain_3,
+                      cls._table_1, cls._table_2, cls._table_3, cls._applied_1,
+                      cls._applied_2, cls._applied_3):
+            array.setflags(write=False)
 
-        self._applied_2 = np.array([
-            [[0.98486974, 0.53526504, 0.03155191],
-             [0.76022687, 0.68458573, 0.64850011]],
-            [[0.98747624, 0.89277461, 0.15505443],
-             [0.85844632, 0.47842591, 0.97972986]],
-            [[0.84903362, 0.93514331, 0.68479574],
-             [0.49827272, 0.99234923, 0.97614054]],
-            [[0.98912224, 0.43850620, 0.89625878],
-             [0.04125691, 0.79115345, 0.93648599]],
-        ])
-
-        self._applied_3 = np.array([
-            [[0.98685765, 0.58844468, 0.09393531],
-             [0.79274650, 0.72453018, 0.69347904]],
-            [[0.98911162, 0.90807837, 0.25736920],
-             [0.87825083, 0.53046097, 0.98225775]],
-            [[0.87021380, 0.94442819, 0.72448386],
-             [0.55350090, 0.99318691, 0.97922787]],
-            [[0.99054268, 0.49317779, 0.91055390],
-             [0.02408419, 0.81991814, 0.94597809]],
-        ])
+        super(TestLUT3D, cls).setUpClass()
 
 
 class TestAbstractLUTSequenceOperator(unittest.TestCase):
@@ -788,8 +799,9 @@ class TestAbstractLUTSequenceOperator(unittest.TestCase):
 
         required_methods = ('apply', )
 
-        for method in required_methods:
-            self.assertIn(method, dir(AbstractLUTSequenceOperator))
+        self.assertSetEqual(
+            set(required_methods).difference(dir(AbstractLUTSequenceOperator)),
+            set())
 
 
 class TestLUTSequence(unittest.TestCase):
@@ -797,14 +809,27 @@ class TestLUTSequence(unittest.TestCase):
     Defines :class:`colour.io.luts.lut.LUTSequence` class unit tests methods.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._table_1 = LUT1D.linear_table(16) + 0.125
+        cls._table_2 = LUT3D.linear_table(16) ** (1 / 2.2)
+        cls._table_3 = LUT3x1D.linear_table(16) * 0.750
+
+        for array in (cls._table_1, cls._table_2, cls._table_3):
+            array.setflags(write=False)
+
     def setUp(self):
         """
         Initialises common tests attributes.
         """
 
-        self._LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125, 'Nemo 1D')
-        self._LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'Nemo 3D')
-        self._LUT_3 = LUT3x1D(LUT3x1D.linear_table(16) * 0.750, 'Nemo 3x1D')
+        self._LUT_1 = LUT1D(self._table_1, 'Nemo 1D')
+        self._LUT_2 = LUT3D(self._table_2, 'Nemo 3D')
+        self._LUT_3 = LUT3x1D(self._table_3, 'Nemo 3x1D')
         self._LUT_sequence = LUTSequence(self._LUT_1, self._LUT_2, self._LUT_3)
 
         samples = np.linspace(0, 1, 5)
@@ -818,8 +843,8 @@ class TestLUTSequence(unittest.TestCase):
 
         required_attributes = ('sequence', )
 
-        for attribute in required_attributes:
-            self.assertIn(attribute, dir(LUTSequence))
+        self.assertSetEqual(
+            set(required_attributes).difference(dir(LUTSequence)), set())
 
     def test_required_methods(self):
         """
@@ -830,8 +855,8 @@ class TestLUTSequence(unittest.TestCase):
                             '__delitem__', '__len__', '__str__', '__repr__',
                             '__eq__', '__ne__', 'insert', 'apply', 'copy')
 
-        for method in required_methods:
-            self.assertIn(method, dir(LUTSequence))
+        self.assertSetEqual(
+            set(required_methods).difference(dir(LUTSequence)), set())
 
     def test_sequence(self):
         """
@@ -1209,11 +1234,9 @@ class TestLUTSequence(unittest.TestCase):
 
         LUT_sequence = self._LUT_sequence.copy()
         LUT_sequence.insert(1, GammaOperator(1 / 2.2))
-        samples = np.linspace(0, 1, 5)
-        RGB = tstack([samples, samples, samples])
 
         np.testing.assert_almost_equal(
-            LUT_sequence.apply(RGB),
+            LUT_sequence.apply(self._RGB),
             np.array([
                 [0.48779047, 0.48779047, 0.48779047],
                 [0.61222338, 0.61222338, 0.61222338],
@@ -1229,19 +1252,360 @@ class TestLUT_to_LUT(unittest.TestCase):
     methods.
     """
 
-    def setUp(self):
-        """
-        Initialises common tests attributes.
-        """
-
-        self._domain = np.array([[0.0, -0.1, -0.2], [1.0, 1.5, 3.0]])
-
-        self._LUT_1 = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2))
-        self._LUT_2 = LUT3x1D(
+    _LUT_1_to_LUT3D_table = np.array([[[
+        [0.00000000, 0.00000000, 0.00000000],
+        [0.00000000, 0.00000000, 0.53156948],
+        [0.00000000, 0.00000000, 0.72933741],
+        [0.00000000, 0.00000000, 0.87726669],
+        [0.00000000, 0.00000000, 1.00000000],
+    ], [
+        [0.00000000, 0.53156948, 0.00000000],
+        [0.00000000, 0.53156948, 0.53156948],
+        [0.00000000, 0.53156948, 0.72933741],
+        [0.00000000, 0.53156948, 0.87726669],
+        [0.00000000, 0.53156948, 1.00000000],
+    ], [
+        [0.00000000, 0.72933741, 0.00000000],
+        [0.00000000, 0.72933741, 0.53156948],
+        [0.00000000, 0.72933741, 0.72933741],
+        [0.00000000, 0.72933741, 0.87726669],
+        [0.00000000, 0.72933741, 1.00000000],
+    ], [
+        [0.00000000, 0.87726669, 0.00000000],
+        [0.00000000, 0.87726669, 0.53156948],
+        [0.00000000, 0.87726669, 0.72933741],
+        [0.00000000, 0.87726669, 0.87726669],
+        [0.00000000, 0.87726669, 1.00000000],
+    ], [
+        [0.00000000, 1.00000000, 0.00000000],
+        [0.00000000, 1.00000000, 0.53156948],
+        [0.00000000, 1.00000000, 0.72933741],
+        [0.00000000, 1.00000000, 0.87726669],
+        [0.00000000, 1.00000000, 1.00000000],
+    ]], [[
+        [0.53156948, 0.00000000, 0.00000000],
+        [0.53156948, 0.00000000, 0.53156948],
+        [0.53156948, 0.00000000, 0.72933741],
+        [0.53156948, 0.00000000, 0.87726669],
+        [0.53156948, 0.00000000, 1.00000000],
+    ], [
+        [0.53156948, 0.53156948, 0.00000000],
+        [0.53156948, 0.53156948, 0.53156948],
+        [0.53156948, 0.53156948, 0.72933741],
+        [0.53156948, 0.53156948, 0.87726669],
+        [0.53156948, 0.53156948, 1.00000000],
+    ], [
+        [0.53156948, 0.72933741, 0.00000000],
+        [0.53156948, 0.72933741, 0.53156948],
+        [0.53156948, 0.72933741, 0.72933741],
+        [0.53156948, 0.72933741, 0.87726669],
+        [0.53156948, 0.72933741, 1.00000000],
+    ], [
+        [0.53156948, 0.87726669, 0.00000000],
+        [0.53156948, 0.87726669, 0.53156948],
+        [0.53156948, 0.87726669, 0.72933741],
+        [0.53156948, 0.87726669, 0.87726669],
+        [0.53156948, 0.87726669, 1.00000000],
+    ], [
+        [0.53156948, 1.00000000, 0.00000000],
+        [0.53156948, 1.00000000, 0.53156948],
+        [0.53156948, 1.00000000, 0.72933741],
+        [0.53156948, 1.00000000, 0.87726669],
+        [0.53156948, 1.00000000, 1.00000000],
+    ]], [[
+        [0.72933741, 0.00000000, 0.00000000],
+        [0.72933741, 0.00000000, 0.53156948],
+        [0.72933741, 0.00000000, 0.72933741],
+        [0.72933741, 0.00000000, 0.87726669],
+        [0.72933741, 0.00000000, 1.00000000],
+    ], [
+        [0.72933741, 0.53156948, 0.00000000],
+        [0.72933741, 0.53156948, 0.53156948],
+        [0.72933741, 0.53156948, 0.72933741],
+        [0.72933741, 0.53156948, 0.87726669],
+        [0.72933741, 0.53156948, 1.00000000],
+    ], [
+        [0.72933741, 0.72933741, 0.00000000],
+        [0.72933741, 0.72933741, 0.53156948],
+        [0.72933741, 0.72933741, 0.72933741],
+        [0.72933741, 0.72933741, 0.87726669],
+        [0.72933741, 0.72933741, 1.00000000],
+    ], [
+        [0.72933741, 0.87726669, 0.00000000],
+        [0.72933741, 0.87726669, 0.53156948],
+        [0.72933741, 0.87726669, 0.72933741],
+        [0.72933741, 0.87726669, 0.87726669],
+        [0.72933741, 0.87726669, 1.00000000],
+    ], [
+        [0.72933741, 1.00000000, 0.00000000],
+        [0.72933741, 1.00000000, 0.53156948],
+        [0.72933741, 1.00000000, 0.72933741],
+        [0.72933741, 1.00000000, 0.87726669],
+        [0.72933741, 1.00000000, 1.00000000],
+    ]], [[
+        [0.87726669, 0.00000000, 0.00000000],
+        [0.87726669, 0.00000000, 0.53156948],
+        [0.87726669, 0.00000000, 0.72933741],
+        [0.87726669, 0.00000000, 0.87726669],
+        [0.87726669, 0.00000000, 1.00000000],
+    ], [
+        [0.87726669, 0.53156948, 0.00000000],
+        [0.87726669, 0.53156948, 0.53156948],
+        [0.87726669, 0.53156948, 0.72933741],
+        [0.87726669, 0.53156948, 0.87726669],
+        [0.87726669, 0.53156948, 1.00000000],
+    ], [
+        [0.87726669, 0.72933741, 0.00000000],
+        [0.87726669, 0.72933741, 0.53156948],
+        [0.87726669, 0.72933741, 0.72933741],
+        [0.87726669, 0.72933741, 0.87726669],
+        [0.87726669, 0.72933741, 1.00000000],
+    ], [
+        [0.87726669, 0.87726669, 0.00000000],
+        [0.87726669, 0.87726669, 0.53156948],
+        [0.87726669, 0.87726669, 0.72933741],
+        [0.87726669, 0.87726669, 0.87726669],
+        [0.87726669, 0.87726669, 1.00000000],
+    ], [
+        [0.87726669, 1.00000000, 0.00000000],
+        [0.87726669, 1.00000000, 0.53156948],
+        [0.87726669, 1.00000000, 0.72933741],
+        [0.87726669, 1.00000000, 0.87726669],
+        [0.87726669, 1.00000000, 1.00000000],
+    ]], [[
+        [1.00000000, 0.00000000, 0.00000000],
+        [1.00000000, 0.00000000, 0.53156948],
+        [1.00000000, 0.00000000, 0.72933741],
+        [1.00000000, 0.00000000, 0.87726669],
+        [1.00000000, 0.00000000, 1.00000000],
+    ], [
+        [1.00000000, 0.53156948, 0.00000000],
+        [1.00000000, 0.53156948, 0.53156948],
+        [1.00000000, 0.53156948, 0.72933741],
+        [1.00000000, 0.53156948, 0.87726669],
+        [1.00000000, 0.53156948, 1.00000000],
+    ], [
+        [1.00000000, 0.72933741, 0.00000000],
+        [1.00000000, 0.72933741, 0.53156948],
+        [1.00000000, 0.72933741, 0.72933741],
+        [1.00000000, 0.72933741, 0.87726669],
+        [1.00000000, 0.72933741, 1.00000000],
+    ], [
+        [1.00000000, 0.87726669, 0.00000000],
+        [1.00000000, 0.87726669, 0.53156948],
+        [1.00000000, 0.87726669, 0.72933741],
+        [1.00000000, 0.87726669, 0.87726669],
+        [1.00000000, 0.87726669, 1.00000000],
+    ], [
+        [1.00000000, 1.00000000, 0.00000000],
+        [1.00000000, 1.00000000, 0.53156948],
+        [1.00000000, 1.00000000, 0.72933741],
+        [1.00000000, 1.00000000, 0.87726669],
+        [1.00000000, 1.00000000, 1.00000000],
+    ]]])
+
+    _LUT_2_to_LUT3D_table = np.array([[[
+        [0.00000000, 0.00000000, 0.00000000],
+        [0.00000000, 0.00000000, 0.26578474],
+        [0.00000000, 0.00000000, 0.36466870],
+        [0.00000000, 0.00000000, 0.43863334],
+        [0.00000000, 0.00000000, 0.50000000],
+    ], [
+        [0.00000000, 0.39867711, 0.00000000],
+        [0.00000000, 0.39867711, 0.26578474],
+        [0.00000000, 0.39867711, 0.36466870],
+        [0.00000000, 0.39867711, 0.43863334],
+        [0.00000000, 0.39867711, 0.50000000],
+    ], [
+        [0.00000000, 0.54700305, 0.00000000],
+        [0.00000000, 0.54700305, 0.26578474],
+        [0.00000000, 0.54700305, 0.36466870],
+        [0.00000000, 0.54700305, 0.43863334],
+        [0.00000000, 0.54700305, 0.50000000],
+    ], [
+        [0.00000000, 0.65795001, 0.00000000],
+        [0.00000000, 0.65795001, 0.26578474],
+        [0.00000000, 0.65795001, 0.36466870],
+        [0.00000000, 0.65795001, 0.43863334],
+        [0.00000000, 0.65795001, 0.50000000],
+    ], [
+        [0.00000000, 0.75000000, 0.00000000],
+        [0.00000000, 0.75000000, 0.26578474],
+        [0.00000000, 0.75000000, 0.36466870],
+        [0.00000000, 0.75000000, 0.43863334],
+        [0.00000000, 0.75000000, 0.50000000],
+    ]], [[
+        [0.53156948, 0.00000000, 0.00000000],
+        [0.53156948, 0.00000000, 0.26578474],
+        [0.53156948, 0.00000000, 0.36466870],
+        [0.53156948, 0.00000000, 0.43863334],
+        [0.53156948, 0.00000000, 0.50000000],
+    ], [
+        [0.53156948, 0.39867711, 0.00000000],
+        [0.53156948, 0.39867711, 0.26578474],
+        [0.53156948, 0.39867711, 0.36466870],
+        [0.53156948, 0.39867711, 0.43863334],
+        [0.53156948, 0.39867711, 0.50000000],
+    ], [
+        [0.53156948, 0.54700305, 0.00000000],
+        [0.53156948, 0.54700305, 0.26578474],
+        [0.53156948, 0.54700305, 0.36466870],
+        [0.53156948, 0.54700305, 0.43863334],
+        [0.53156948, 0.54700305, 0.50000000],
+    ], [
+        [0.53156948, 0.65795001, 0.00000000],
+        [0.53156948, 0.65795001, 0.26578474],
+        [0.53156948, 0.65795001, 0.36466870],
+        [0.53156948, 0.65795001, 0.43863334],
+        [0.53156948, 0.65795001, 0.50000000],
+    ], [
+        [0.53156948, 0.75000000, 0.00000000],
+        [0.53156948, 0.75000000, 0.26578474],
+        [0.53156948, 0.75000000, 0.36466870],
+        [0.53156948, 0.75000000, 0.43863334],
+        [0.53156948, 0.75000000, 0.50000000],
+    ]], [[
+        [0.72933741, 0.00000000, 0.00000000],
+        [0.72933741, 0.00000000, 0.26578474],
+        [0.72933741, 0.00000000, 0.36466870],
+        [0.72933741, 0.00000000, 0.43863334],
+        [0.72933741, 0.00000000, 0.50000000],
+    ], [
+        [0.72933741, 0.39867711, 0.00000000],
+        [0.72933741, 0.39867711, 0.26578474],
+        [0.72933741, 0.39867711, 0.36466870],
+        [0.72933741, 0.39867711, 0.43863334],
+        [0.72933741, 0.39867711, 0.50000000],
+    ], [
+        [0.72933741, 0.54700305, 0.00000000],
+        [0.72933741, 0.54700305, 0.26578474],
+        [0.72933741, 0.54700305, 0.36466870],
+        [0.72933741, 0.54700305, 0.43863334],
+        [0.72933741, 0.54700305, 0.50000000],
+    ], [
+        [0.72933741, 0.65795001, 0.00000000],
+        [0.72933741, 0.65795001, 0.26578474],
+        [0.72933741, 0.65795001, 0.36466870],
+        [0.72933741, 0.65795001, 0.43863334],
+        [0.72933741, 0.65795001, 0.50000000],
+    ], [
+        [0.72933741, 0.75000000, 0.00000000],
+        [0.72933741, 0.75000000, 0.26578474],
+        [0.72933741, 0.75000000, 0.36466870],
+        [0.72933741, 0.75000000, 0.43863334],
+        [0.72933741, 0.75000000, 0.50000000],
+    ]], [[
+        [0.87726669, 0.00000000, 0.00000000],
+        [0.87726669, 0.00000000, 0.26578474],
+        [0.87726669, 0.00000000, 0.36466870],
+        [0.87726669, 0.00000000, 0.43863334],
+        [0.87726669, 0.00000000, 0.50000000],
+    ], [
+        [0.87726669, 0.39867711, 0.00000000],
+        [0.87726669, 0.39867711, 0.26578474],
+        [0.87726669, 0.39867711, 0.36466870],
+        [0.87726669, 0.39867711, 0.43863334],
+        [0.87726669, 0.39867711, 0.50000000],
+    ], [
+        [0.87726669, 0.54700305, 0.00000000],
+        [0.87726669, 0.54700305, 0.26578474],
+        [0.87726669, 0.54700305, 0.36466870],
+        [0.87726669, 0.54700305, 0.43863334],
+        [0.87726669, 0.54700305, 0.50000000],
+    ], [
+        [0.87726669, 0.65795001, 0.00000000],
+        [0.87726669, 0.65795001, 0.26578474],
+        [0.87726669, 0.65795001, 0.36466870],
+        [0.87726669, 0.65795001, 0.43863334],
+        [0.87726669, 0.65795001, 0.50000000],
+    ], [
+        [0.87726669, 0.75000000, 0.00000000],
+        [0.87726669, 0.75000000, 0.26578474],
+        [0.87726669, 0.75000000, 0.36466870],
+        [0.87726669, 0.75000000, 0.43863334],
+        [0.87726669, 0.75000000, 0.50000000],
+    ]], [[
+        [1.00000000, 0.00000000, 0.00000000],
+        [1.00000000, 0.00000000, 0.26578474],
+        [1.00000000, 0.00000000, 0.36466870],
+        [1.00000000, 0.00000000, 0.43863334],
+        [1.00000000, 0.00000000, 0.50000000],
+    ], [
+        [1.00000000, 0.39867711, 0.00000000],
+        [1.00000000, 0.39867711, 0.26578474],
+        [1.00000000, 0.39867711, 0.36466870],
+        [1.00000000, 0.39867711, 0.43863334],
+        [1.00000000, 0.39867711, 0.50000000],
+    ], [
+        [1.00000000, 0.54700305, 0.00000000],
+        [1.00000000, 0.54700305, 0.26578474],
+        [1.00000000, 0.54700305, 0.36466870],
+        [1.00000000, 0.54700305, 0.43863334],
+        [1.00000000, 0.54700305, 0.50000000],
+    ], [
+        [1.00000000, 0.65795001, 0.00000000],
+        [1.00000000, 0.65795001, 0.26578474],
+        [1.00000000, 0.65795001, 0.36466870],
+        [1.00000000, 0.65795001, 0.43863334],
+        [1.00000000, 0.65795001, 0.50000000],
+    ], [
+        [1.00000000, 0.75000000, 0.00000000],
+        [1.00000000, 0.75000000, 0.26578474],
+        [1.00000000, 0.75000000, 0.36466870],
+        [1.00000000, 0.75000000, 0.43863334],
+        [1.00000000, 0.75000000, 0.50000000],
+    ]]])
+
+    _LUT_3_to_LUT1D_table_1 = np.array([
+        0.00000000, 0.29202031, 0.40017033, 0.48115651, 0.54837380, 0.60691337,
+        0.65935329, 0.70721023, 0.75146458, 0.79279273, 0.83168433, 0.86850710,
+        0.90354543, 0.93702451, 0.96912624, 1.00000000
+    ])
+
+    _LUT_3_to_LUT1D_table_2 = np.array([
+        0.04562817, 0.24699999, 0.40967557, 0.50401689, 0.57985117, 0.64458830,
+        0.70250077, 0.75476586, 0.80317708, 0.83944710, 0.86337188, 0.88622285,
+        0.90786039, 0.92160338, 0.92992641, 0.93781796
+    ])
+
+    _LUT_3_to_LUT3x1D_table = np.array([
+        [0.00000000, 0.00000000, 0.00000000],
+        [0.29202031, 0.29202031, 0.29202031],
+        [0.40017033, 0.40017033, 0.40017033],
+        [0.48115651, 0.48115651, 0.48115651],
+        [0.54837380, 0.54837380, 0.54837380],
+        [0.60691337, 0.60691337, 0.60691337],
+        [0.65935329, 0.65935329, 0.65935329],
+        [0.70721023, 0.70721023, 0.70721023],
+        [0.75146458, 0.75146458, 0.75146458],
+        [0.79279273, 0.79279273, 0.79279273],
+        [0.83168433, 0.83168433, 0.83168433],
+        [0.86850710, 0.86850710, 0.86850710],
+        [0.90354543, 0.90354543, 0.90354543],
+        [0.93702451, 0.93702451, 0.93702451],
+        [0.96912624, 0.96912624, 0.96912624],
+        [1.00000000, 1.00000000, 1.00000000],
+    ])
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._domain = np.array([[0.0, -0.1, -0.2], [1.0, 1.5, 3.0]])
+        cls._domain.setflags(write=False)
+
+        # "LUT_to_LUT" definition does not mutate its input, the source *LUTs*
+        # tables are frozen to guarantee that they can be safely shared.
+        cls._LUT_1 = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2))
+        cls._LUT_2 = LUT3x1D(
             LUT3x1D.linear_table(16) ** (1 / 2.2) * (1.0, 0.75, 0.5),
-            domain=self._domain)
-        self._LUT_3 = LUT3D(
-            LUT3D.linear_table(16) ** (1 / 2.2), domain=self._domain)
+            domain=cls._domain)
+        cls._LUT_3 = LUT3D(
+            LUT3D.linear_table(16) ** (1 / 2.2), domain=cls._domain)
+        for LUT in (cls._LUT_1, cls._LUT_2, cls._LUT_3):
+            LUT.table.setflags(write=False)
 
     def test_LUT_to_LUT(self):
         """
@@ -1265,159 +1629,7 @@ class TestLUT_to_LUT(unittest.TestCase):
         LUT = LUT_to_LUT(self._LUT_1, LUT3D, force_conversion=True, size=5)
 
         np.testing.assert_almost_equal(
-            LUT.table,
-            np.array([[[
-                [0.00000000, 0.00000000, 0.00000000],
-                [0.00000000, 0.00000000, 0.53156948],
-                [0.00000000, 0.00000000, 0.72933741],
-                [0.00000000, 0.00000000, 0.87726669],
-                [0.00000000, 0.00000000, 1.00000000],
-            ], [
-                [0.00000000, 0.53156948, 0.00000000],
-                [0.00000000, 0.53156948, 0.53156948],
-                [0.00000000, 0.53156948, 0.72933741],
-                [0.00000000, 0.53156948, 0.87726669],
-                [0.00000000, 0.53156948, 1.00000000],
-            ], [
-                [0.00000000, 0.72933741, 0.00000000],
-                [0.00000000, 0.72933741, 0.53156948],
-                [0.00000000, 0.72933741, 0.72933741],
-                [0.00000000, 0.72933741, 0.87726669],
-                [0.00000000, 0.72933741, 1.00000000],
-            ], [
-                [0.00000000, 0.87726669, 0.00000000],
-                [0.00000000, 0.87726669, 0.53156948],
-                [0.00000000, 0.87726669, 0.72933741],
-                [0.00000000, 0.87726669, 0.87726669],
-                [0.00000000, 0.87726669, 1.00000000],
-            ], [
-                [0.00000000, 1.00000000, 0.00000000],
-                [0.00000000, 1.00000000, 0.53156948],
-                [0.00000000, 1.00000000, 0.72933741],
-                [0.00000000, 1.00000000, 0.87726669],
-                [0.00000000, 1.00000000, 1.00000000],
-            ]], [[
-                [0.53156948, 0.00000000, 0.00000000],
-                [0.53156948, 0.00000000, 0.53156948],
-                [0.53156948, 0.00000000, 0.72933741],
-                [0.53156948, 0.00000000, 0.87726669],
-                [0.53156948, 0.00000000, 1.00000000],
-            ], [
-                [0.53156948, 0.53156948, 0.00000000],
-                [0.53156948, 0.53156948, 0.53156948],
-                [0.53156948, 0.53156948, 0.72933741],
-                [0.53156948, 0.53156948, 0.87726669],
-                [0.53156948, 0.53156948, 1.00000000],
-            ], [
-                [0.53156948, 0.72933741, 0.00000000],
-                [0.53156948, 0.72933741, 0.53156948],
-                [0.53156948, 0.72933741, 0.72933741],
-                [0.53156948, 0.72933741, 0.87726669],
-                [0.53156948, 0.72933741, 1.00000000],
-            ], [
-                [0.53156948, 0.87726669, 0.00000000],
-                [0.53156948, 0.87726669, 0.53156948],
-                [0.53156948, 0.87726669, 0.72933741],
-                [0.53156948, 0.87726669, 0.87726669],
-                [0.53156948, 0.87726669, 1.00000000],
-            ], [
-                [0.53156948, 1.00000000, 0.00000000],
-                [0.53156948, 1.00000000, 0.53156948],
-                [0.53156948, 1.00000000, 0.72933741],
-                [0.53156948, 1.00000000, 0.87726669],
-                [0.53156948, 1.00000000, 1.00000000],
-            ]], [[
-                [0.72933741, 0.00000000, 0.00000000],
-                [0.72933741, 0.00000000, 0.53156948],
-                [0.72933741, 0.00000000, 0.72933741],
-                [0.72933741, 0.00000000, 0.87726669],
-                [0.72933741, 0.00000000, 1.00000000],
-            ], [
-                [0.72933741, 0.53156948, 0.00000000],
-                [0.72933741, 0.53156948, 0.53156948],
-                [0.72933741, 0.53156948, 0.72933741],
-                [0.72933741, 0.53156948, 0.87726669],
-                [0.72933741, 0.53156948, 1.00000000],
-            ], [
-                [0.72933741, 0.72933741, 0.00000000],
-                [0.72933741, 0.72933741, 0.53156948],
-                [0.72933741, 0.72933741, 0.72933741],
-                [0.72933741, 0.72933741, 0.87726669],
-                [0.72933741, 0.72933741, 1.00000000],
-            ], [
-                [0.72933741, 0.87726669, 0.00000000],
-                [0.72933741, 0.87726669, 0.53156948],
-                [0.72933741, 0.87726669, 0.72933741],
-                [0.72933741, 0.87726669, 0.87726669],
-                [0.72933741, 0.87726669, 1.00000000],
-            ], [
-                [0.72933741, 1.00000000, 0.00000000],
-                [0.72933741, 1.00000000, 0.53156948],
-                [0.72933741, 1.00000000, 0.72933741],
-                [0.72933741, 1.00000000, 0.87726669],
-                [0.72933741, 1.00000000, 1.00000000],
-            ]], [[
-                [0.87726669, 0.00000000, 0.00000000],
-                [0.87726669, 0.00000000, 0.53156948],
-                [0.87726669, 0.00000000, 0.72933741],
-                [0.87726669, 0.00000000, 0.87726669],
-                [0.87726669, 0.00000000, 1.00000000],
-            ], [
-                [0.87726669, 0.53156948, 0.00000000],
-                [0.87726669, 0.53156948, 0.53156948],
-                [0.87726669, 0.53156948, 0.72933741],
-                [0.87726669, 0.53156948, 0.87726669],
-                [0.87726669, 0.53156948, 1.00000000],
-            ], [
-                [0.87726669, 0.72933741, 0.00000000],
-                [0.87726669, 0.72933741, 0.53156948],
-                [0.87726669, 0.72933741, 0.72933741],
-                [0.87726669, 0.72933741, 0.87726669],
-                [0.87726669, 0.72933741, 1.00000000],
-            ], [
-                [0.87726669, 0.87726669, 0.00000000],
-                [0.87726669, 0.87726669, 0.53156948],
-                [0.87726669, 0.87726669, 0.72933741],
-                [0.87726669, 0.87726669, 0.87726669],
-                [0.87726669, 0.87726669, 1.00000000],
-            ], [
-                [0.87726669, 1.00000000, 0.00000000],
-                [0.87726669, 1.00000000, 0.53156948],
-                [0.87726669, 1.00000000, 0.72933741],
-                [0.87726669, 1.00000000, 0.87726669],
-                [0.87726669, 1.00000000, 1.00000000],
-            ]], [[
-                [1.00000000, 0.00000000, 0.00000000],
-                [1.00000000, 0.00000000, 0.53156948],
-                [1.00000000, 0.00000000, 0.72933741],
-                [1.00000000, 0.00000000, 0.87726669],
-                [1.00000000, 0.00000000, 1.00000000],
-            ], [
-                [1.00000000, 0.53156948, 0.00000000],
-                [1.00000000, 0.53156948, 0.53156948],
-                [1.00000000, 0.53156948, 0.72933741],
-                [1.00000000, 0.53156948, 0.87726669],
-                [1.00000000, 0.53156948, 1.00000000],
-            ], [
-                [1.00000000, 0.72933741, 0.00000000],
-                [1.00000000, 0.72933741, 0.53156948],
-                [1.00000000, 0.72933741, 0.72933741],
-                [1.00000000, 0.72933741, 0.87726669],
-                [1.00000000, 0.72933741, 1.00000000],
-            ], [
-                [1.00000000, 0.87726669, 0.00000000],
-                [1.00000000, 0.87726669, 0.53156948],
-                [1.00000000, 0.87726669, 0.72933741],
-                [1.00000000, 0.87726669, 0.87726669],
-                [1.00000000, 0.87726669, 1.00000000],
-            ], [
-                [1.00000000, 1.00000000, 0.00000000],
-                [1.00000000, 1.00000000, 0.53156948],
-                [1.00000000, 1.00000000, 0.72933741],
-                [1.00000000, 1.00000000, 0.87726669],
-                [1.00000000, 1.00000000, 1.00000000],
-            ]]]),
-            decimal=7)
+            LUT.table, self._LUT_1_to_LUT3D_table, decimal=7)
 
         # "LUT" 3x1D to "LUT" 1D.
         self.assertRaises(ValueError, lambda: LUT_to_LUT(self._LUT_2, LUT1D))
@@ -1429,6 +1641,9 @@ class TestLUT_to_LUT(unittest.TestCase):
             force_conversion=True,
             channel_weights=channel_weights)
 
+        self.assertEqual(
+            LUT, LUT1D(self._LUT_2.table[..., 0], domain=self._domain[..., 0]))
+
         channel_weights = np.array([1 / 3, 1 / 3, 1 / 3])
 
         domain = np.sum(self._domain * channel_weights, axis=-1)
@@ -1456,159 +1671,7 @@ class TestLUT_to_LUT(unittest.TestCase):
         LUT = LUT_to_LUT(self._LUT_2, LUT3D, force_conversion=True, size=5)
 
         np.testing.assert_almost_equal(
-            LUT.table,
-            np.array([[[
-                [0.00000000, 0.00000000, 0.00000000],
-                [0.00000000, 0.00000000, 0.26578474],
-                [0.00000000, 0.00000000, 0.36466870],
-                [0.00000000, 0.00000000, 0.43863334],
-                [0.00000000, 0.00000000, 0.50000000],
-            ], [
-                [0.00000000, 0.39867711, 0.00000000],
-                [0.00000000, 0.39867711, 0.26578474],
-                [0.00000000, 0.39867711, 0.36466870],
-                [0.00000000, 0.39867711, 0.43863334],
-                [0.00000000, 0.39867711, 0.50000000],
-            ], [
-                [0.00000000, 0.54700305, 0.00000000],
-                [0.00000000, 0.54700305, 0.26578474],
-                [0.00000000, 0.54700305, 0.36466870],
-                [0.00000000, 0.54700305, 0.43863334],
-                [0.00000000, 0.54700305, 0.50000000],
-            ], [
-                [0.00000000, 0.65795001, 0.00000000],
-                [0.00000000, 0.65795001, 0.26578474],
-                [0.00000000, 0.65795001, 0.36466870],
-                [0.00000000, 0.65795001, 0.43863334],
-                [0.00000000, 0.65795001, 0.50000000],
-            ], [
-                [0.00000000, 0.75000000, 0.00000000],
-                [0.00000000, 0.75000000, 0.26578474],
-                [0.00000000, 0.75000000, 0.36466870],
-                [0.00000000, 0.75000000, 0.43863334],
-                [0.00000000, 0.75000000, 0.50000000],
-            ]], [[
-                [0.53156948, 0.00000000, 0.00000000],
-                [0.53156948, 0.00000000, 0.26578474],
-                [0.53156948, 0.00000000, 0.36466870],
-                [0.53156948, 0.00000000, 0.43863334],
-                [0.53156948, 0.00000000, 0.50000000],
-            ], [
-                [0.53156948, 0.39867711, 0.00000000],
-                [0.53156948, 0.39867711, 0.26578474],
-                [0.53156948, 0.39867711, 0.36466870],
-                [0.53156948, 0.39867711, 0.43863334],
-                [0.53156948, 0.39867711, 0.50000000],
-            ], [
-                [0.53156948, 0.54700305, 0.00000000],
-                [0.53156948, 0.54700305, 0.26578474],
-                [0.53156948, 0.54700305, 0.36466870],
-                [0.53156948, 0.54700305, 0.43863334],
-                [0.53156948, 0.54700305, 0.50000000],
-            ], [
-                [0.53156948, 0.65795001, 0.00000000],
-                [0.53156948, 0.65795001, 0.26578474],
-                [0.53156948, 0.65795001, 0.36466870],
-                [0.53156948, 0.65795001, 0.43863334],
-                [0.53156948, 0.65795001, 0.50000000],
-            ], [
-                [0.53156948, 0.75000000, 0.00000000],
-                [0.53156948, 0.75000000, 0.26578474],
-                [0.53156948, 0.75000000, 0.36466870],
-                [0.53156948, 0.75000000, 0.43863334],
-                [0.53156948, 0.75000000, 0.50000000],
-            ]], [[
-                [0.72933741, 0.00000000, 0.00000000],
-                [0.72933741, 0.00000000, 0.26578474],
-                [0.72933741, 0.00000000, 0.36466870],
-                [0.72933741, 0.00000000, 0.43863334],
-                [0.72933741, 0.00000000, 0.50000000],
-            ], [
-                [0.72933741, 0.39867711, 0.00000000],
-                [0.72933741, 0.39867711, 0.26578474],
-                [0.72933741, 0.39867711, 0.36466870],
-                [0.72933741, 0.39867711, 0.43863334],
-                [0.72933741, 0.39867711, 0.50000000],
-            ], [
-                [0.72933741, 0.54700305, 0.00000000],
-                [0.72933741, 0.54700305, 0.26578474],
-                [0.72933741, 0.54700305, 0.36466870],
-                [0.72933741, 0.54700305, 0.43863334],
-                [0.72933741, 0.54700305, 0.50000000],
-            ], [
-                [0.72933741, 0.65795001, 0.00000000],
-                [0.72933741, 0.65795001, 0.26578474],
-                [0.72933741, 0.65795001, 0.36466870],
-                [0.72933741, 0.65795001, 0.43863334],
-                [0.72933741, 0.65795001, 0.50000000],
-            ], [
-                [0.72933741, 0.75000000, 0.00000000],
-                [0.72933741, 0.75000000, 0.26578474],
-                [0.72933741, 0.75000000, 0.36466870],
-                [0.72933741, 0.75000000, 0.43863334],
-                [0.72933741, 0.75000000, 0.50000000],
-            ]], [[
-                [0.87726669, 0.00000000, 0.00000000],
-                [0.87726669, 0.00000000, 0.26578474],
-                [0.87726669, 0.00000000, 0.36466870],
-                [0.87726669, 0.00000000, 0.43863334],
-                [0.87726669, 0.00000000, 0.50000000],
-            ], [
-                [0.87726669, 0.39867711, 0.00000000],
-                [0.87726669, 0.39867711, 0.26578474],
-                [0.87726669, 0.39867711, 0.36466870],
-                [0.87726669, 0.39867711, 0.43863334],
-                [0.87726669, 0.39867711, 0.50000000],
-            ], [
-                [0.87726669, 0.54700305, 0.00000000],
-                [0.87726669, 0.54700305, 0.26578474],
-                [0.87726669, 0.54700305, 0.36466870],
-                [0.87726669, 0.54700305, 0.43863334],
-                [0.87726669, 0.54700305, 0.50000000],
-            ], [
-                [0.87726669, 0.65795001, 0.00000000],
-                [0.87726669, 0.65795001, 0.26578474],
-                [0.87726669, 0.65795001, 0.36466870],
-                [0.87726669, 0.65795001, 0.43863334],
-                [0.87726669, 0.65795001, 0.50000000],
-            ], [
-                [0.87726669, 0.75000000, 0.00000000],
-                [0.87726669, 0.75000000, 0.26578474],
-                [0.87726669, 0.75000000, 0.36466870],
-                [0.87726669, 0.75000000, 0.43863334],
-                [0.87726669, 0.75000000, 0.50000000],
-            ]], [[
-                [1.00000000, 0.00000000, 0.00000000],
-                [1.00000000, 0.00000000, 0.26578474],
-                [1.00000000, 0.00000000, 0.36466870],
-                [1.00000000, 0.00000000, 0.43863334],
-                [1.00000000, 0.00000000, 0.50000000],
-            ], [
-                [1.00000000, 0.39867711, 0.00000000],
-                [1.00000000, 0.39867711, 0.26578474],
-                [1.00000000, 0.39867711, 0.36466870],
-                [1.00000000, 0.39867711, 0.43863334],
-                [1.00000000, 0.39867711, 0.50000000],
-            ], [
-                [1.00000000, 0.54700305, 0.00000000],
-                [1.00000000, 0.54700305, 0.26578474],
-                [1.00000000, 0.54700305, 0.36466870],
-                [1.00000000, 0.54700305, 0.43863334],
-                [1.00000000, 0.54700305, 0.50000000],
-            ], [
-                [1.00000000, 0.65795001, 0.00000000],
-                [1.00000000, 0.65795001, 0.26578474],
-                [1.00000000, 0.65795001, 0.36466870],
-                [1.00000000, 0.65795001, 0.43863334],
-                [1.00000000, 0.65795001, 0.50000000],
-            ], [
-                [1.00000000, 0.75000000, 0.00000000],
-                [1.00000000, 0.75000000, 0.26578474],
-                [1.00000000, 0.75000000, 0.36466870],
-                [1.00000000, 0.75000000, 0.43863334],
-                [1.00000000, 0.75000000, 0.50000000],
-            ]]]),
-            decimal=7)
+            LUT.table, self._LUT_2_to_LUT3D_table, decimal=7)
 
         # "LUT" 3D to "LUT" 1D.
         self.assertRaises(ValueError, lambda: LUT_to_LUT(self._LUT_3, LUT1D))
@@ -1621,14 +1684,7 @@ class TestLUT_to_LUT(unittest.TestCase):
             size=16,
             channel_weights=channel_weights)
 
-        np.testing.assert_almost_equal(
-            LUT.table,
-            np.array([
-                0.00000000, 0.29202031, 0.40017033, 0.48115651, 0.54837380,
-                0.60691337, 0.65935329, 0.70721023, 0.75146458, 0.79279273,
-                0.83168433, 0.86850710, 0.90354543, 0.93702451, 0.96912624,
-                1.00000000
-            ]))
+        np.testing.assert_almost_equal(LUT.table, self._LUT_3_to_LUT1D_table_1)
 
         channel_weights = np.array([1 / 3, 1 / 3, 1 / 3])
         LUT = LUT_to_LUT(
@@ -1638,40 +1694,14 @@ class TestLUT_to_LUT(unittest.TestCase):
             size=16,
             channel_weights=channel_weights)
 
-        np.testing.assert_almost_equal(
-            LUT.table,
-            np.array([
-                0.04562817, 0.24699999, 0.40967557, 0.50401689, 0.57985117,
-                0.64458830, 0.70250077, 0.75476586, 0.80317708, 0.83944710,
-                0.86337188, 0.88622285, 0.90786039, 0.92160338, 0.92992641,
-                0.93781796
-            ]))
+        np.testing.assert_almost_equal(LUT.table, self._LUT_3_to_LUT1D_table_2)
 
         # "LUT" 3D to "LUT" 3x1D.
         self.assertRaises(ValueError, lambda: LUT_to_LUT(self._LUT_3, LUT3x1D))
 
         LUT = LUT_to_LUT(self._LUT_3, LUT3x1D, force_conversion=True, size=16)
 
-        np.testing.assert_almost_equal(
-            LUT.table,
-            np.array([
-                [0.00000000, 0.00000000, 0.00000000],
-                [0.29202031, 0.29202031, 0.29202031],
-                [0.40017033, 0.40017033, 0.40017033],
-                [0.48115651, 0.48115651, 0.48115651],
-                [0.54837380, 0.54837380, 0.54837380],
-                [0.60691337, 0.60691337, 0.60691337],
-                [0.65935329, 0.65935329, 0.65935329],
-                [0.70721023, 0.70721023, 0.70721023],
-                [0.75146458, 0.75146458, 0.75146458],
-                [0.79279273, 0.79279273, 0.79279273],
-                [0.83168433, 0.83168433, 0.83168433],
-                [0.86850710, 0.86850710, 0.86850710],
-                [0.90354543, 0.90354543, 0.90354543],
-                [0.93702451, 0.93702451, 0.93702451],
-                [0.96912624, 0.96912624, 0.96912624],
-                [1.00000000, 1.00000000, 1.00000000],
-            ]))
+        np.testing.assert_almost_equal(LUT.table, self._LUT_3_to_LUT3x1D_table)
 
         # "LUT" 3D to "LUT" 3D.
         LUT = LUT_to_LUT(self._LUT_3, LUT3D)
@@ -3,6 +3,7 @@
 Defines unit tests for :mod:`colour.io.luts.resolve_cube` module.
 """
 
+import copy
 import numpy as np
 import os
 import unittest
@@ -32,14 +33,28 @@ class TestReadLUTResolveCube(unittest.TestCase):
     unit tests methods.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._LUT_1 = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        cls._LUT_2 = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'Demo.cube'))
+        cls._LUT_3 = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'Three_Dimensional_Table.cube'))
+        cls._LUT_4 = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'LogC_Video.cube'))
+
     def test_read_LUT_ResolveCube(self):
         """
         Tests :func:`colour.io.luts.resolve_cube.read_LUT_ResolveCube`
         definition.
         """
 
-        LUT_1 = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        LUT_1 = self._LUT_1
 
         np.testing.assert_almost_equal(
             LUT_1.table,
@@ -84,18 +99,16 @@ class TestReadLUTResolveCube(unittest.TestCase):
         self.assertEqual(LUT_1.size, 32)
         self.assertListEqual(LUT_1.comments, [])
 
-        LUT_2 = read_LUT_ResolveCube(os.path.join(LUTS_DIRECTORY, 'Demo.cube'))
+        LUT_2 = self._LUT_2
         self.assertListEqual(LUT_2.comments, ["Comments can't go anywhere"])
         np.testing.assert_array_equal(LUT_2.domain,
                                       np.array([[0, 0, 0], [3, 3, 3]]))
 
-        LUT_3 = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'Three_Dimensional_Table.cube'))
+        LUT_3 = self._LUT_3
         self.assertEqual(LUT_3.dimensions, 3)
         self.assertEqual(LUT_3.size, 2)
 
-        LUT_4 = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'LogC_Video.cube'))
+        LUT_4 = self._LUT_4
         np.testing.assert_almost_equal(
             LUT_4[0].table,
             np.array([
@@ -119,6 +132,15 @@ class TestReadLUTResolveCube(unittest.TestCase):
         )
         self.assertEqual(LUT_4[1].size, 4)
 
+    def test_raise_exception_read_LUT_ResolveCube(self):
+        """
+        Tests :func:`colour.io.luts.resolve_cube.read_LUT_ResolveCube`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, read_LUT_ResolveCube,
+                          os.path.join(LUTS_DIRECTORY, 'Malformed.cube'))
+
 
 class TestWriteLUTResolveCube(unittest.TestCase):
     """
@@ -126,6 +148,22 @@ class TestWriteLUTResolveCube(unittest.TestCase):
     definition unit tests methods.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """
+        Initialises common tests attributes once for the class.
+        """
+
+        cls._LUT_1_r = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        cls._LUT_2_r = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'Demo.cube'))
+        cls._LUT_3_r = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY, 'Three_Dimensional_Table.cube'))
+        cls._LUT_4_r = read_LUT_ResolveCube(
+            os.path.join(LUTS_DIRECTORY,
+                         'Three_Dimensional_Table_With_Shaper.cube'))
+
     def setUp(self):
         """
         Initialises common tests attributes.
@@ -146,8 +184,7 @@ class TestWriteLUTResolveCube(unittest.TestCase):
         definition.
         """
 
-        LUT_1_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        LUT_1_r = self._LUT_1_r
 
         write_LUT_ResolveCube(
             LUT_1_r,
@@ -160,8 +197,7 @@ class TestWriteLUTResolveCube(unittest.TestCase):
 
         self.assertEqual(LUT_1_r, LUT_1_t)
 
-        LUT_2_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'Demo.cube'))
+        LUT_2_r = self._LUT_2_r
 
         write_LUT_ResolveCube(
             LUT_2_r, os.path.join(self._temporary_directory, 'Demo.cube'))
@@ -172,8 +208,7 @@ class TestWriteLUTResolveCube(unittest.TestCase):
         self.assertEqual(LUT_2_r, LUT_2_t)
         self.assertListEqual(LUT_2_r.comments, LUT_2_t.comments)
 
-        LUT_3_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'Three_Dimensional_Table.cube'))
+        LUT_3_r = self._LUT_3_r
 
         write_LUT_ResolveCube(
             LUT_3_r,
@@ -186,15 +221,15 @@ class TestWriteLUTResolveCube(unittest.TestCase):
 
         self.assertEqual(LUT_3_r, LUT_3_t)
 
-        LUT_4_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY,
-                         'Three_Dimensional_Table_With_Shaper.cube'))
+        # The shaper conversion mutates the sequence, the shared reference
+        # *LUT* is thus copied beforehand.
+        LUT_4_c = copy.deepcopy(self._LUT_4_r)
 
-        LUT_4_r.sequence[0] = LUT_4_r.sequence[0].as_LUT(
+        LUT_4_c.sequence[0] = LUT_4_c.sequence[0].as_LUT(
             LUT1D, force_conversion=True)
 
         write_LUT_ResolveCube(
-            LUT_4_r,
+            LUT_4_c,
             os.path.join(self._temporary_directory,
                          'Three_Dimensional_Table_With_Shaper.cube'))
 
@@ -202,14 +237,9 @@ class TestWriteLUTResolveCube(unittest.TestCase):
             os.path.join(self._temporary_directory,
                          'Three_Dimensional_Table_With_Shaper.cube'))
 
-        LUT_4_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY,
-                         'Three_Dimensional_Table_With_Shaper.cube'))
+        self.assertEqual(self._LUT_4_r, LUT_4_t)
 
-        self.assertEqual(LUT_4_r, LUT_4_t)
-
-        LUT_5_r = read_LUT_ResolveCube(
-            os.path.join(LUTS_DIRECTORY, 'ACES_Proxy_10_to_ACES.cube'))
+        LUT_5_r = self._LUT_1_r
 
         write_LUT_ResolveCube(
             LUT_5_r.as_LUT(LUT1D, force_conversion=True),
@@ -16,9 +16,11 @@ References
 an-1016-hunter-rd-a-b-color-scale-update-12-07-03.pdf
 """
 
+import numpy as np
+
 from colour.colorimetry import TVS_ILLUMINANTS_HUNTERLAB
 from colour.models import XYZ_to_K_ab_HunterLab1966
-from colour.utilities import from_range_100, to_domain_100, tsplit, tstack
+from colour.utilities import as_float_array, from_range_100, to_domain_100
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -90,19 +92,24 @@ def XYZ_to_Hunter_Rdab(XYZ,
     array([ 12.197225 ...,  57.1253787...,  17.4624134...])
     """
 
-    X, Y, Z = tsplit(to_domain_100(XYZ))
-    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n))
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else tsplit(K_ab))
+    K_ab = (XYZ_to_K_ab_HunterLab1966(XYZ_n)
+            if K_ab is None else as_float_array(K_ab))
+    XYZ = to_domain_100(XYZ)
+    XYZ_n = to_domain_100(XYZ_n)
+
+    X, Y, Z = XYZ[..., 0], XYZ[..., 1], XYZ[..., 2]
+    X_n, Y_n, Z_n = XYZ_n[..., 0], XYZ_n[..., 1], XYZ_n[..., 2]
+    K_a, K_b = K_ab[..., 0], K_ab[..., 1]
 
     f = 0.51 * ((21 + 0.2 * Y) / (1 + 0.2 * Y))
     Y_Yn = Y / Y_n
 
-    R_d = Y
-    a_Rd = K_a * f * (X / X_n - Y_Yn)
-    b_Rd = K_b * f * (Y_Yn - Z / Z_n)
-
-    R_d_ab = tstack([R_d, a_Rd, b_Rd])
+    # The components are written directly into the output array, avoiding the
+    # intermediate copies made by "tsplit" and "tstack".
+    R_d_ab = np.empty(XYZ.shape, dtype=XYZ.dtype)
+    R_d_ab[..., 0] = Y
+    R_d_ab[..., 1] = K_a * f * (X / X_n - Y_Yn)
+    R_d_ab[..., 2] = K_b * f * (Y_Yn - Z / Z_n)
 
     return from_range_100(R_d_ab)
 
@@ -166,16 +173,21 @@ def Hunter_Rdab_to_XYZ(R_d_ab,
     array([ 20.654008,  12.197225,   5.136952])
     """
 
-    R_d, a_Rd, b_Rd = tsplit(to_domain_100(R_d_ab))
-    X_n, Y_n, Z_n = tsplit(to_domain_100(XYZ_n))
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else tsplit(K_ab))
+    K_ab = (XYZ_to_K_ab_HunterLab1966(XYZ_n)
+            if K_ab is None else as_float_array(K_ab))
+    R_d_ab = to_domain_100(R_d_ab)
+    XYZ_n = to_domain_100(XYZ_n)
+
+    R_d, a_Rd, b_Rd = R_d_ab[..., 0], R_d_ab[..., 1], R_d_ab[..., 2]
+    X_n, Y_n, Z_n = XYZ_n[..., 0], XYZ_n[..., 1], XYZ_n[..., 2]
+    K_a, K_b = K_ab[..., 0], K_ab[..., 1]
 
     f = 0.51 * ((21 + 0.2 * R_d) / (1 + 0.2 * R_d))
     Rd_Yn = R_d / Y_n
-    X = (a_Rd / (K_a * f) + Rd_Yn) * X_n
-    Z = -(b_Rd / (K_b * f) - Rd_Yn) * Z_n
 
-    XYZ = tstack([X, R_d, Z])
+    XYZ = np.empty(R_d_ab.shape, dtype=R_d_ab.dtype)
+    XYZ[..., 0] = (a_Rd / (K_a * f) + Rd_Yn) * X_n
+    XYZ[..., 1] = R_d
+    XYZ[..., 2] = -(b_Rd / (K_b * f) - Rd_Yn) * Z_n
 
     return from_range_100(XYZ)
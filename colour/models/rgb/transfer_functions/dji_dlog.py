@@ -18,7 +18,9 @@ D-Log_D-Gamut_Whitepaper.pdf
 
 import numpy as np
 
-from colour.utilities import as_float, from_range_1, to_domain_1
+from colour.constants import LOG2_10
+from colour.utilities import (as_float, as_float_array, from_range_1,
+                              to_domain_1)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -69,10 +71,13 @@ def log_encoding_DJIDLog(x):
     0.3987645...
     """
 
-    x = to_domain_1(x)
+    x = to_domain_1(x, copy=False)
 
-    y = np.where(x <= 0.0078, 6.025 * x + 0.0929,
-                 (np.log10(x * 0.9892 + 0.0108)) * 0.256663 + 0.584555)
+    y = as_float_array(6.025 * x + 0.0929)
+
+    logarithmic = x > 0.0078
+    y[logarithmic] = (
+        np.log10(x[logarithmic] * 0.9892 + 0.0108) * 0.256663 + 0.584555)
 
     return as_float(from_range_1(y))
 
@@ -116,9 +121,12 @@ def log_decoding_DJIDLog(y):
     0.1799998...
     """
 
-    y = to_domain_1(y)
+    y = to_domain_1(y, copy=False)
 
-    x = np.where(y <= 0.14, (y - 0.0929) / 6.025,
-                 (10 ** (3.89616 * y - 2.27752) - 0.0108) / 0.9892)
+    x = np.where(
+        y <= 0.14,
+        (y - 0.0929) / 6.025,
+        (np.exp2((3.89616 * y - 2.27752) * LOG2_10) - 0.0108) / 0.9892,
+    )
 
     return as_float(from_range_1(x))
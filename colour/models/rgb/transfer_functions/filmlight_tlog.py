@@ -16,7 +16,8 @@ References
 
 import numpy as np
 
-from colour.utilities import as_float, from_range_1, to_domain_1
+from colour.utilities import (as_float, as_float_array, from_range_1,
+                              to_domain_1)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -97,7 +98,7 @@ def log_encoding_FilmLightTLog(x, w=128.0, g=16.0, o=0.075):
     0.3965678...
     """
 
-    x = to_domain_1(x)
+    x = to_domain_1(x, copy=False)
 
     b = 1.0 / (0.7107 + 1.2359 * np.log(w * g))
     gs = g / (1.0 - o)
@@ -109,11 +110,10 @@ def log_encoding_FilmLightTLog(x, w=128.0, g=16.0, o=0.075):
     B = b * s
     G = gs * s
 
-    t = np.where(
-        x < 0.0,
-        G * x + o,
-        np.log(x + C) * B + A,
-    )
+    t = as_float_array(G * x + o)
+
+    logarithmic = x >= 0.0
+    t[logarithmic] = np.log(x[logarithmic] + C) * B + A
 
     return as_float(from_range_1(t))
 
@@ -187,7 +187,7 @@ def log_decoding_FilmLightTLog(t, w=128.0, g=16.0, o=0.075):
     0.1800000...
     """
 
-    t = to_domain_1(t)
+    t = to_domain_1(t, copy=False)
 
     b = 1.0 / (0.7107 + 1.2359 * np.log(w * g))
     gs = g / (1.0 - o)
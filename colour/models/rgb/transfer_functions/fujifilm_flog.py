@@ -17,8 +17,10 @@ F-Log_DataSheet_E_Ver.1.0.pdf
 
 import numpy as np
 
+from colour.constants import LOG2_10
 from colour.models.rgb.transfer_functions import full_to_legal, legal_to_full
-from colour.utilities import Structure, as_float, from_range_1, to_domain_1
+from colour.utilities import (Structure, as_float, as_float_array,
+                              from_range_1, to_domain_1)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -107,7 +109,7 @@ def log_encoding_FLog(in_r,
     array([ 95, 470, 705])
     """
 
-    in_r = to_domain_1(in_r)
+    in_r = to_domain_1(in_r, copy=False)
 
     if not in_reflection:
         in_r = in_r * 0.9
@@ -120,11 +122,10 @@ def log_encoding_FLog(in_r,
     e = constants.e
     f = constants.f
 
-    out_r = np.where(
-        in_r < cut1,
-        e * in_r + f,
-        c * np.log10(a * in_r + b) + d,
-    )
+    out_r = as_float_array(e * in_r + f)
+
+    logarithmic = in_r >= cut1
+    out_r[logarithmic] = c * np.log10(a * in_r[logarithmic] + b) + d
 
     out_r = (out_r
              if out_normalised_code_value else legal_to_full(out_r, bit_depth))
@@ -185,7 +186,7 @@ def log_decoding_FLog(out_r,
     0.1800000...
     """
 
-    out_r = to_domain_1(out_r)
+    out_r = to_domain_1(out_r, copy=False)
 
     out_r = (out_r
              if in_normalised_code_value else full_to_legal(out_r, bit_depth))
@@ -198,11 +199,13 @@ def log_decoding_FLog(out_r,
     e = constants.e
     f = constants.f
 
-    in_r = np.where(
-        out_r < cut2,
-        (out_r - f) / e,
-        (10 ** ((out_r - d) / c)) / a - b / a,
-    )
+    in_r = as_float_array(out_r - d)
+    in_r *= LOG2_10 / c
+    np.exp2(in_r, out=in_r)
+    in_r /= a
+    in_r -= b / a
+
+    in_r = np.where(out_r < cut2, (out_r - f) / e, in_r)
 
     if not out_reflection:
         in_r = in_r / 0.9
@@ -22,7 +22,7 @@ R-REC-BT.601-7-201103-I!!PDF-E.pdf
 import numpy as np
 
 from colour.algebra import spow
-from colour.utilities import (as_float, domain_range_scale, from_range_1,
+from colour.utilities import (as_float, as_float_array, from_range_1,
                               to_domain_1)
 
 __author__ = 'Colour Developers'
@@ -34,6 +34,15 @@ __status__ = 'Production'
 
 __all__ = ['oetf_BT601', 'oetf_inverse_BT601']
 
+_E_LINEAR_THRESHOLD_BT601 = 1.099 * 0.018 ** 0.45 - 0.099
+"""
+*Recommendation ITU-R BT.601-7* electrical signal :math:`E` below which the
+inverse opto-electronic transfer function is linear, i.e. the value of
+:func:`colour.models.oetf_BT601` definition for :math:`L = 0.018`.
+
+_E_LINEAR_THRESHOLD_BT601 : numeric
+"""
+
 
 def oetf_BT601(L):
     """
@@ -75,9 +84,16 @@ def oetf_BT601(L):
     0.4090077...
     """
 
-    L = to_domain_1(L)
+    L = to_domain_1(L, copy=False)
+
+    # "spow" definition returns a scalar for single element arrays, the
+    # output is thus reshaped to match the input.
+    E = as_float_array(spow(L, 0.45)).reshape(L.shape)
+    E *= 1.099
+    E -= 0.099
 
-    E = np.where(L < 0.018, L * 4.5, 1.099 * spow(L, 0.45) - 0.099)
+    linear = L < 0.018
+    E[linear] = L[linear] * 4.5
 
     return as_float(from_range_1(E))
 
@@ -122,13 +138,12 @@ def oetf_inverse_BT601(E):
     0.1...
     """
 
-    E = to_domain_1(E)
+    E = to_domain_1(E, copy=False)
 
-    with domain_range_scale('ignore'):
-        L = np.where(
-            E < oetf_BT601(0.018),
-            E / 4.5,
-            spow((E + 0.099) / 1.099, 1 / 0.45),
-        )
+    L = np.where(
+        E < _E_LINEAR_THRESHOLD_BT601,
+        E / 4.5,
+        spow((E + 0.099) / 1.099, 1 / 0.45),
+    )
 
     return as_float(from_range_1(L))
@@ -11,7 +11,7 @@ from colour.models.rgb.transfer_functions import (
     CCTF_DECODINGS, CCTF_ENCODINGS, EOTFS, EOTF_INVERSES, LOG_DECODINGS,
     LOG_ENCODINGS, OETFS, OETF_INVERSES, OOTFS, OOTF_INVERSES, cctf_encoding,
     cctf_decoding)
-from colour.utilities import ColourUsageWarning, as_int
+from colour.utilities import ColourUsageWarning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -94,21 +94,36 @@ class TestTransferFunctions(unittest.TestCase):
             (OOTFS, OOTF_INVERSES),
         ]
 
-        samples = np.hstack([
-            np.linspace(0, 1, as_int(1e5)),
-            np.linspace(0, 65504, 65504 * 10)
-        ])
-
+        # A linear sweep of the unit interval combined with a logarithmically
+        # stratified sweep up to the half-float maximum exercises every
+        # segment of the piecewise functions with a small sample count.
+        samples = np.unique(
+            np.concatenate([
+                np.linspace(0, 1, 512),
+                np.geomspace(1e-6, 65504, 4096),
+                np.array([0.0, 0.015, 0.18, 1.0]),
+            ]))
+
+        # The same callables are registered in several mappings, each pair is
+        # only exercised once.
+        tested = set()
         for encoding_mapping, _decoding_mapping in reciprocal_mappings:
             for name in encoding_mapping:
                 if name in ignored_transfer_functions:
                     continue
 
-                encoded_s = CCTF_ENCODINGS[name](samples)
-                decoded_s = CCTF_DECODINGS[name](encoded_s)
+                key = (id(CCTF_ENCODINGS[name]), id(CCTF_DECODINGS[name]))
+                if key in tested:
+                    continue
+
+                tested.add(key)
+
+                with self.subTest(name=name):
+                    encoded_s = CCTF_ENCODINGS[name](samples)
+                    decoded_s = CCTF_DECODINGS[name](encoded_s)
 
-                np.testing.assert_almost_equal(
-                    samples, decoded_s, decimal=decimals.get(name, 7))
+                    np.testing.assert_almost_equal(
+                        samples, decoded_s, decimal=decimals.get(name, 7))
 
 
 if __name__ == '__main__':
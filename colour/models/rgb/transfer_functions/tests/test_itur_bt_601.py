@@ -61,6 +61,10 @@ oetf_BT601` definition n-dimensional arrays support.
         E = np.reshape(E, (2, 3, 1))
         np.testing.assert_almost_equal(oetf_BT601(L), E, decimal=7)
 
+        L = np.array([0.18])
+        E = np.array([E[0, 0, 0]])
+        np.testing.assert_almost_equal(oetf_BT601(L), E, decimal=7)
+
     def test_domain_range_scale_oetf_BT601(self):
         """
         Tests :func:`colour.models.rgb.transfer_functions.itur_bt_601.\
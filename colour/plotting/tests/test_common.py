@@ -96,7 +96,8 @@ class TestXyzToPlottingColourspace(unittest.TestCase):
         definition.
         """
 
-        XYZ = np.random.random(3)
+        prng = np.random.RandomState(2)
+        XYZ = prng.random_sample(3)
         np.testing.assert_almost_equal(
             XYZ_to_sRGB(XYZ), XYZ_to_plotting_colourspace(XYZ), decimal=7)
 
@@ -143,6 +144,13 @@ class TestArtist(unittest.TestCase):
     methods.
     """
 
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        plt.close('all')
+
     def test_artist(self):
         """
         Tests :func:`colour.plotting.common.artist` definition.
@@ -166,6 +174,13 @@ class TestCamera(unittest.TestCase):
     methods.
     """
 
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        plt.close('all')
+
     def test_camera(self):
         """
         Tests :func:`colour.plotting.common.camera` definition.
@@ -200,6 +215,8 @@ class TestRender(unittest.TestCase):
 
         shutil.rmtree(self._temporary_directory)
 
+        plt.close('all')
+
     def test_render(self):
         """
         Tests :func:`colour.plotting.common.render` definition.
@@ -239,6 +256,13 @@ class TestLabelRectangles(unittest.TestCase):
     tests methods.
     """
 
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        plt.close('all')
+
     def test_label_rectangles(self):
         """
         Tests :func:`colour.plotting.common.label_rectangles` definition.
@@ -260,6 +284,13 @@ class TestUniformAxes3d(unittest.TestCase):
     methods.
     """
 
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        plt.close('all')
+
     def test_uniform_axes3d(self):
         """
         Tests :func:`colour.plotting.common.uniform_axes3d` definition.
@@ -515,28 +546,38 @@ class TestPlotMultiFunctions(unittest.TestCase):
             'Gamma 2.4': lambda x: x ** (1 / 2.4),
             'Gamma 2.6': lambda x: x ** (1 / 2.6),
         }
-        plot_kwargs = {'c': 'r'}
-        figure, axes = plot_multi_functions(functions, plot_kwargs=plot_kwargs)
-
-        self.assertIsInstance(figure, Figure)
-        self.assertIsInstance(axes, Axes)
-
-        plot_kwargs = [{'c': 'r'}, {'c': 'g'}, {'c': 'b'}]
-        figure, axes = plot_multi_functions(
-            functions, log_x=10, log_y=10, plot_kwargs=plot_kwargs)
-
-        self.assertIsInstance(figure, Figure)
-        self.assertIsInstance(axes, Axes)
-
-        figure, axes = plot_multi_functions(functions, log_x=10)
-
-        self.assertIsInstance(figure, Figure)
-        self.assertIsInstance(axes, Axes)
+        cases = (
+            {
+                'plot_kwargs': {
+                    'c': 'r'
+                }
+            },
+            {
+                'log_x': 10,
+                'log_y': 10,
+                'plot_kwargs': [{
+                    'c': 'r'
+                }, {
+                    'c': 'g'
+                }, {
+                    'c': 'b'
+                }],
+            },
+            {
+                'log_x': 10
+            },
+            {
+                'log_y': 10
+            },
+        )
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                figure, axes = plot_multi_functions(functions, **kwargs)
 
-        figure, axes = plot_multi_functions(functions, log_y=10)
+                self.assertIsInstance(figure, Figure)
+                self.assertIsInstance(axes, Axes)
 
-        self.assertIsInstance(figure, Figure)
-        self.assertIsInstance(axes, Axes)
+                plt.close(figure)
 
 
 class TestPlotImage(unittest.TestCase):
@@ -555,8 +596,8 @@ class TestPlotImage(unittest.TestCase):
 
         # Distribution does not ship the documentation thus we are skipping
         # this unit test if the image does not exist.
-        if not os.path.exists(path):  # noqa
-            return
+        if not os.path.exists(path):
+            self.skipTest('"{0}" image does not exist!'.format(path))
 
         figure, axes = plot_image(read_image(path))
 
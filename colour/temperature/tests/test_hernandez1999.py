@@ -5,7 +5,6 @@ Defines unit tests for :mod:`colour.temperature.hernandez1999` module.
 
 import numpy as np
 import unittest
-from itertools import permutations
 
 from colour.temperature import xy_to_CCT_Hernandez1999, CCT_to_xy_Hernandez1999
 from colour.utilities import ignore_numpy_errors
@@ -74,10 +73,11 @@ class Testxy_to_CCT_Hernandez1999(unittest.TestCase):
         definition nan support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=2))
-        for case in cases:
-            xy_to_CCT_Hernandez1999(case)
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        cases = np.reshape(
+            np.stack(np.meshgrid(cases, cases, indexing='ij'), axis=-1),
+            (-1, 2))
+        xy_to_CCT_Hernandez1999(cases)
 
 
 class TestCCT_to_xy_Hernandez1999(unittest.TestCase):
@@ -133,10 +133,11 @@ class TestCCT_to_xy_Hernandez1999(unittest.TestCase):
         definition nan support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=2))
-        for case in cases:
-            CCT_to_xy_Hernandez1999(case)
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        cases = np.reshape(
+            np.stack(np.meshgrid(cases, cases, indexing='ij'), axis=-1),
+            (-1, 2))
+        CCT_to_xy_Hernandez1999(cases)
 
 
 if __name__ == '__main__':
@@ -966,7 +966,7 @@ class domain_range_scale:
         return wrapper
 
 
-def to_domain_1(a, scale_factor=100, dtype=None):
+def to_domain_1(a, scale_factor=100, dtype=None, copy=True):
     """
     Scales given array :math:`a` to domain **'1'**. The behaviour is as
     follows:
@@ -987,6 +987,10 @@ def to_domain_1(a, scale_factor=100, dtype=None):
         axis need different scaling to be brought to domain **'1'**.
     dtype : object, optional
         Data type used for the conversion to :class:`np.ndarray`.
+    copy : bool, optional
+        Whether to return a copy of :math:`a` when it is not scaled. If set to
+        *False*, the returned array may share its memory with :math:`a` and
+        must not be modified in-place.
 
     Returns
     -------
@@ -1017,7 +1021,10 @@ def to_domain_1(a, scale_factor=100, dtype=None):
     if dtype is None:
         dtype = DEFAULT_FLOAT_DTYPE
 
-    a = np.asarray(a, dtype).copy()
+    a = np.asarray(a, dtype)
+
+    if copy or _DOMAIN_RANGE_SCALE == '100':
+        a = a.copy()
 
     if _DOMAIN_RANGE_SCALE == '100':
         a /= scale_factor
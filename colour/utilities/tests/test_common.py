@@ -508,6 +508,16 @@ class TestToDomain1(unittest.TestCase):
             self.assertEqual(
                 to_domain_1(1, dtype=np.float16).dtype, np.float16)
 
+        a = np.array([0.25, 0.5, 1.0])
+        with domain_range_scale('Reference'):
+            self.assertFalse(np.shares_memory(to_domain_1(a), a))
+            self.assertTrue(np.shares_memory(to_domain_1(a, copy=False), a))
+
+        with domain_range_scale('100'):
+            np.testing.assert_equal(
+                to_domain_1(a, copy=False), np.array([0.0025, 0.005, 0.01]))
+            np.testing.assert_equal(a, np.array([0.25, 0.5, 1.0]))
+
 
 class TestToDomain10(unittest.TestCase):
     """
@@ -28,8 +28,9 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     ----------
     points : array_like
         Points to check if they are within ``mesh`` volume.
-    mesh : array_like
-        Points of the volume used to generate the Delaunay triangulation.
+    mesh : array_like or Delaunay
+        Points of the volume used to generate the Delaunay triangulation or an
+        already generated Delaunay triangulation.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
 
@@ -55,7 +56,7 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    triangulation = mesh if isinstance(mesh, Delaunay) else Delaunay(mesh)
 
     simplex = triangulation.find_simplex(points, tol=tolerance)
     simplex = np.where(simplex >= 0, True, False)
@@ -6,6 +6,8 @@ Pointer's Gamut Volume Computations
 Defines objects related to *Pointer's Gamut* volume computations.
 """
 
+from scipy.spatial import Delaunay
+
 from colour.models import (Lab_to_XYZ, LCHab_to_Lab, DATA_POINTER_GAMUT_VOLUME,
                            CCS_ILLUMINANT_POINTER_GAMUT)
 from colour.volume import is_within_mesh_volume
@@ -19,6 +21,8 @@ __status__ = 'Production'
 
 __all__ = ['is_within_pointer_gamut']
 
+_CACHE_POINTER_GAMUT_XYZ_TRIANGULATION = {}
+
 
 def is_within_pointer_gamut(XYZ, tolerance=None):
     """
@@ -56,7 +60,14 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    XYZ_p = Lab_to_XYZ(
-        LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME), CCS_ILLUMINANT_POINTER_GAMUT)
+    triangulation = _CACHE_POINTER_GAMUT_XYZ_TRIANGULATION.get(
+        'DATA_POINTER_GAMUT_VOLUME')
+    if triangulation is None:
+        XYZ_p = Lab_to_XYZ(
+            LCHab_to_Lab(DATA_POINTER_GAMUT_VOLUME),
+            CCS_ILLUMINANT_POINTER_GAMUT)
+
+        _CACHE_POINTER_GAMUT_XYZ_TRIANGULATION['DATA_POINTER_GAMUT_VOLUME'] = \
+            triangulation = Delaunay(XYZ_p)
 
-    return is_within_mesh_volume(XYZ, XYZ_p, tolerance)
+    return is_within_mesh_volume(XYZ, triangulation, tolerance)
@@ -6,6 +6,7 @@ Defines unit tests for :mod:`colour.volume.mesh` module.
 import numpy as np
 import unittest
 from itertools import permutations
+from scipy.spatial import Delaunay
 
 from colour.volume import is_within_mesh_volume
 from colour.utilities import ignore_numpy_errors
@@ -60,6 +61,14 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(
                 np.array([0.4325, 0.3788, 0.1034]), self._mesh))
 
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0005, 0.0031, 0.0010]), Delaunay(self._mesh)))
+
+        self.assertFalse(
+            is_within_mesh_volume(
+                np.array([0.3205, 0.4131, 0.5100]), Delaunay(self._mesh)))
+
     def test_n_dimensional_is_within_mesh_volume(self):
         """
         Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
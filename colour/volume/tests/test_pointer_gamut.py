@@ -5,7 +5,6 @@ Defines unit tests for :mod:`colour.volume.pointer_gamut` module.
 
 import numpy as np
 import unittest
-from itertools import permutations
 
 from colour.volume import is_within_pointer_gamut
 from colour.utilities import ignore_numpy_errors
@@ -32,17 +31,14 @@ class TestIsWithinPointerGamut(unittest.TestCase):
         definition.
         """
 
-        self.assertTrue(
-            is_within_pointer_gamut(np.array([0.3205, 0.4131, 0.5100])))
-
-        self.assertFalse(
-            is_within_pointer_gamut(np.array([0.0005, 0.0031, 0.0010])))
-
-        self.assertTrue(
-            is_within_pointer_gamut(np.array([0.4325, 0.3788, 0.1034])))
-
-        self.assertFalse(
-            is_within_pointer_gamut(np.array([0.0025, 0.0088, 0.0340])))
+        np.testing.assert_array_equal(
+            is_within_pointer_gamut(
+                np.array([
+                    [0.3205, 0.4131, 0.5100],
+                    [0.0005, 0.0031, 0.0010],
+                    [0.4325, 0.3788, 0.1034],
+                    [0.0025, 0.0088, 0.0340],
+                ])), np.array([True, False, True, False]))
 
     def test_n_dimensional_is_within_pointer_gamut(self):
         """
@@ -68,10 +64,11 @@ class TestIsWithinPointerGamut(unittest.TestCase):
         definition nan support.
         """
 
-        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
-        cases = set(permutations(cases * 3, r=3))
-        for case in cases:
-            is_within_pointer_gamut(case)
+        cases = np.array([-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan])
+        cases = np.reshape(
+            np.stack(np.meshgrid(cases, cases, cases, indexing='ij'), axis=-1),
+            (-1, 3))
+        is_within_pointer_gamut(cases)
 
 
 if __name__ == '__main__':
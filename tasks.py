@@ -67,12 +67,15 @@ def clean(ctx, docs=True, bytecode=False):
         patterns.append('docs/_build')
         patterns.append('docs/generated')
 
-    if bytecode:
-        patterns.append('**/__pycache__')
-        patterns.append('**/*.pyc')
+    ctx.run('rm -rf {0}'.format(' '.join(patterns)))
 
-    for pattern in patterns:
-        ctx.run("rm -rf {}".format(pattern))
+    # The shell does not expand "**" recursively, the bytecode files are
+    # thus removed with "find", limited to the project directories.
+    if bytecode:
+        directories = ' '.join([PYTHON_PACKAGE_NAME, 'utilities', 'docs'])
+        ctx.run("find {0} -type d -name '__pycache__' -prune "
+                "-exec rm -rf {{}} +".format(directories))
+        ctx.run("find {0} -type f -name '*.pyc' -delete".format(directories))
 
 
 @task
@@ -110,9 +113,11 @@ def formatting(ctx, yapf=False, asciify=True, bibtex=True):
     message_box('Cleaning up "BibTeX" file...')
     bibtex_path = BIBLIOGRAPHY_NAME
     with open(bibtex_path) as bibtex_file:
-        bibtex = biblib.bib.Parser().parse(bibtex_file.read()).get_entries()
+        entries = sorted(
+            biblib.bib.Parser().parse(bibtex_file).get_entries().values(),
+            key=lambda x: x.key)
 
-    for entry in sorted(bibtex.values(), key=lambda x: x.key):
+    for entry in entries:
         try:
             del entry['file']
         except KeyError:
@@ -122,7 +127,7 @@ def formatting(ctx, yapf=False, asciify=True, bibtex=True):
             entry[key] = re.sub('(?<!\\\\)\\&', '\\&', value)
 
     with open(bibtex_path, 'w') as bibtex_file:
-        for entry in sorted(bibtex.values(), key=lambda x: x.key):
+        for entry in entries:
             bibtex_file.write(entry.to_bib())
             bibtex_file.write('\n')
 
@@ -490,12 +495,10 @@ def tag(ctx):
         version = '.'.join((major_version, minor_version, change_version))
 
         result = ctx.run('git ls-remote --tags upstream', hide='both')
-        remote_tags = result.stdout.strip().split('\n')
-        tags = set()
-        for remote_tag in remote_tags:
-            tags.add(
-                remote_tag.split('refs/tags/')[1].replace('refs/tags/', '^{}'))
-        tags = sorted(list(tags))
+        tags = sorted(
+            set(
+                re.findall('refs/tags/(\\S+?)(?:\\^\\{\\})?$', result.stdout,
+                           re.MULTILINE)))
         assert 'v{0}'.format(version) not in tags, (
             'A "{0}" "v{1}" tag already exists in remote repository!'.format(
                 PYTHON_PACKAGE_NAME, version))